@@ -1,8 +1,55 @@
+import asyncio
+import functools
+import hashlib
+import http.client
 import json
 import os
+import ssl
+import threading
 import time
+import urllib.error
 import urllib.request
+from collections import OrderedDict
 from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+_JSON_LOCAL = threading.local()
+
+
+def _simdjson_loads(data):
+    # simdjson parsers are not thread-safe and invalidate documents on reuse, so keep one
+    # per thread and always materialize plain Python objects.
+    parser = getattr(_JSON_LOCAL, "parser", None)
+    if parser is None:
+        parser = simdjson.Parser()
+        _JSON_LOCAL.parser = parser
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return parser.parse(data, recursive=True)
+
+
+if orjson is not None:
+    _loads = orjson.loads
+elif simdjson is not None:
+    _loads = _simdjson_loads
+else:
+    _loads = json.loads
+
+if orjson is not None:
+    _dumps = orjson.dumps
+else:
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
 
 DEFAULT_BASE_URL = "https://ollama.eeveon.com/api/generate"
 DEFAULT_MODEL = "qwen3-coder:480b-cloud"
@@ -13,7 +60,31 @@ try:
 except ValueError:
     DEFAULT_TIMEOUT_S = 60
 
-AI_CONFIG_FILE = Path.home() / ".eeveon" / "config" / "ai.json"
+try:
+    RESPONSE_CACHE_TTL_S = int(os.getenv("EEVEON_LLM_CACHE_TTL", "1800"))
+except ValueError:
+    RESPONSE_CACHE_TTL_S = 1800
+
+RESPONSE_CACHE_MAX_ENTRIES = 512
+
+_RESPONSE_CACHE = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# Keep-alive connections are per thread: http.client connections are not thread-safe.
+_HTTP_LOCAL = threading.local()
+_SSL_CONTEXT = None
+
+# Plain string path for the hot read path; os.stat/open on a str skip Path overhead.
+_AI_CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".eeveon", "config", "ai.json")
+AI_CONFIG_FILE = Path(_AI_CONFIG_PATH)
+
+_CFG_CACHE = None
+_CFG_STAMP = None
+
+_SecretsManager = None
+_DECRYPTED_API_KEYS = {}
+_ENCRYPTED_API_KEYS = {}
+_API_KEY_MEMO_STAMP = None
 
 DEFAULT_AI_CONFIG = {
     "provider": DEFAULT_PROVIDER,
@@ -51,16 +122,76 @@ TOOL_SCHEMA = {
     },
 }
 
+_PROMPT_TOOLS = (
+    "deploy: args {branch, environment, canary_percent?, dry_run?} (environment must match pipeline name)",
+    "rollback: args {service, target_version?} (service must match pipeline name)",
+    "scale: args {service, replicas, region?, dry_run?}",
+    "pause_automation: args {service, environment}",
+    "resume_automation: args {service, environment}",
+    "explain: args {command}",
+)
+
+# The schema/tool preamble never changes, so it is sent as a stable system prompt that
+# providers can serve from their prefix (KV) cache; only the request varies per call.
+SYSTEM_PROMPT = (
+    "You are EEveon. Respond ONLY with valid JSON matching this schema exactly "
+    "(no extra keys): "
+    "{\"tool\":\"<tool>\",\"args\":{...},\"safety\":{\"requires_confirmation\":true|false,"
+    "\"reason\":\"\"}}. Allowed tools: "
+    + "; ".join(_PROMPT_TOOLS)
+    + "."
+)
+
+_PROMPT_PREFIX = SYSTEM_PROMPT + " Request: "
+
+
+def _get_secrets_manager():
+    global _SecretsManager
+    if _SecretsManager is None:
+        try:
+            from .cli import SecretsManager
+        except Exception:
+            return None
+        _SecretsManager = SecretsManager
+    return _SecretsManager
+
+
+def _api_key_memo(secrets_manager):
+    # The memo is only valid for the _system_ key it was built with; regenerating
+    # that key file must not hand back ciphertext the new key cannot decrypt.
+    global _API_KEY_MEMO_STAMP
+    stamp = secrets_manager.key_stamp("_system_")
+    if stamp != _API_KEY_MEMO_STAMP:
+        _DECRYPTED_API_KEYS.clear()
+        _ENCRYPTED_API_KEYS.clear()
+        _API_KEY_MEMO_STAMP = stamp
+    return _DECRYPTED_API_KEYS, _ENCRYPTED_API_KEYS
+
+
+def _remember_api_key(plaintext, encrypted):
+    # Small two-way memo so re-saving the same key reuses its ciphertext.
+    if len(_DECRYPTED_API_KEYS) >= 4:
+        _DECRYPTED_API_KEYS.clear()
+        _ENCRYPTED_API_KEYS.clear()
+    _DECRYPTED_API_KEYS[encrypted] = plaintext
+    _ENCRYPTED_API_KEYS[plaintext] = encrypted
+
 
 def _decrypt_api_key(value):
     if not value or not isinstance(value, str):
         return None
     if value.startswith("ENC:"):
-        try:
-            from .cli import SecretsManager
-        except Exception:
+        secrets_manager = _get_secrets_manager()
+        if secrets_manager is None:
             return None
-        return SecretsManager.decrypt("_system_", value[4:])
+        decrypted_keys, _ = _api_key_memo(secrets_manager)
+        cached = decrypted_keys.get(value)
+        if cached is not None:
+            return cached
+        decrypted = secrets_manager.decrypt("_system_", value[4:])
+        if decrypted is not None:
+            _remember_api_key(decrypted, value)
+        return decrypted
     return value
 
 
@@ -69,20 +200,33 @@ def _encrypt_api_key(value):
         return value
     if value.startswith("ENC:"):
         return value
-    try:
-        from .cli import SecretsManager
-    except Exception:
+    secrets_manager = _get_secrets_manager()
+    if secrets_manager is None:
         return value
-    return "ENC:" + SecretsManager.encrypt("_system_", value)
+    _, encrypted_keys = _api_key_memo(secrets_manager)
+    cached = encrypted_keys.get(value)
+    if cached is not None:
+        return cached
+    encrypted = "ENC:" + secrets_manager.encrypt("_system_", value)
+    _remember_api_key(value, encrypted)
+    return encrypted
+
+
+@functools.lru_cache(maxsize=1)
+def _env_overrides():
+    # The process environment is treated as fixed; call _env_overrides.cache_clear() after changing it.
+    return (
+        os.getenv("EEVEON_LLM_PROVIDER"),
+        os.getenv("EEVEON_LLM_BASE_URL"),
+        os.getenv("EEVEON_LLM_MODEL"),
+        os.getenv("EEVEON_LLM_TIMEOUT"),
+        os.getenv("EEVEON_LLM_API_KEY"),
+    )
 
 
 def get_llm_config(provider=None, base_url=None, model=None, timeout_s=None, api_key=None):
     config = load_ai_config()
-    env_provider = os.getenv("EEVEON_LLM_PROVIDER")
-    env_base_url = os.getenv("EEVEON_LLM_BASE_URL")
-    env_model = os.getenv("EEVEON_LLM_MODEL")
-    env_timeout = os.getenv("EEVEON_LLM_TIMEOUT")
-    env_api_key = os.getenv("EEVEON_LLM_API_KEY")
+    env_provider, env_base_url, env_model, env_timeout, env_api_key = _env_overrides()
     if timeout_s is None:
         resolved_timeout = config.get("timeout_s", DEFAULT_TIMEOUT_S)
         if env_timeout:
@@ -104,17 +248,36 @@ def get_llm_config(provider=None, base_url=None, model=None, timeout_s=None, api
     )
 
 
+def _invalidate_ai_config_cache():
+    global _CFG_CACHE, _CFG_STAMP
+    _CFG_CACHE = None
+    _CFG_STAMP = None
+
+
 def load_ai_config():
+    global _CFG_CACHE, _CFG_STAMP
+    try:
+        st = os.stat(_AI_CONFIG_PATH)
+    except FileNotFoundError:
+        return DEFAULT_AI_CONFIG.copy()
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _CFG_CACHE is not None and stamp == _CFG_STAMP:
+        return _CFG_CACHE.copy()
+
     config = DEFAULT_AI_CONFIG.copy()
-    if AI_CONFIG_FILE.exists():
-        try:
-            data = json.loads(AI_CONFIG_FILE.read_text())
-        except json.JSONDecodeError:
-            data = {}
-        for key in config.keys():
-            if key in data:
-                config[key] = data[key]
-    return config
+    try:
+        with open(_AI_CONFIG_PATH, "rb") as f:
+            data = _loads(f.read())
+    except FileNotFoundError:
+        return DEFAULT_AI_CONFIG.copy()
+    except ValueError:
+        data = {}
+    for key in config.keys():
+        if key in data:
+            config[key] = data[key]
+    _CFG_CACHE = config
+    _CFG_STAMP = stamp
+    return config.copy()
 
 
 def save_ai_config(config):
@@ -123,84 +286,283 @@ def save_ai_config(config):
     data.update(config or {})
     if data.get("api_key"):
         data["api_key"] = _encrypt_api_key(data["api_key"])
-    AI_CONFIG_FILE.write_text(json.dumps(data, indent=2) + "\n")
+    _invalidate_ai_config_cache()
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        encoded = (json.dumps(data, indent=2) + "\n").encode("utf-8")
+    # Write-then-rename so a concurrent load_ai_config never sees a partial file.
+    tmp_path = f"{_AI_CONFIG_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(encoded)
+    os.replace(tmp_path, _AI_CONFIG_PATH)
     return data
 
 
 def build_prompt(request):
-    tools_list = [
-        "deploy: args {branch, environment, canary_percent?, dry_run?} (environment must match pipeline name)",
-        "rollback: args {service, target_version?} (service must match pipeline name)",
-        "scale: args {service, replicas, region?, dry_run?}",
-        "pause_automation: args {service, environment}",
-        "resume_automation: args {service, environment}",
-        "explain: args {command}",
-    ]
-    return (
-        "You are EEveon. Respond ONLY with valid JSON matching this schema exactly "
-        "(no extra keys): "
-        "{\"tool\":\"<tool>\",\"args\":{...},\"safety\":{\"requires_confirmation\":true|false,"
-        "\"reason\":\"\"}}. Allowed tools: "
-        + "; ".join(tools_list)
-        + ". Request: "
-        + request
-    )
+    return _PROMPT_PREFIX + request
+
+
+def build_prompt_parts(request):
+    return SYSTEM_PROMPT, request
+
+
+def _get_ssl_context():
+    # Loading the CA bundle is expensive; build one context and share it.
+    global _SSL_CONTEXT
+    if _SSL_CONTEXT is None:
+        _SSL_CONTEXT = ssl.create_default_context()
+    return _SSL_CONTEXT
 
 
-def call_llm(prompt, provider, base_url, model, timeout_s, api_key=None):
+def _get_http_pool():
+    pool = getattr(_HTTP_LOCAL, "pool", None)
+    if pool is None:
+        pool = {}
+        _HTTP_LOCAL.pool = pool
+    return pool
+
+
+def _get_connection(scheme, netloc, timeout_s):
+    pool = _get_http_pool()
+    key = (scheme, netloc)
+    conn = pool.get(key)
+    if conn is None:
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(
+                netloc, timeout=timeout_s, context=_get_ssl_context()
+            )
+        else:
+            conn = http.client.HTTPConnection(netloc, timeout=timeout_s)
+        pool[key] = conn
+    else:
+        conn.timeout = timeout_s
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout_s)
+    return conn
+
+
+def _drop_connection(scheme, netloc):
+    conn = _get_http_pool().pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def close_http_connections():
+    pool = _get_http_pool()
+    for conn in pool.values():
+        conn.close()
+    pool.clear()
+
+
+def _read_body(resp):
+    # Fill a buffer sized from Content-Length; the JSON parsers accept it directly.
+    length = resp.length
+    if not length:
+        return resp.read()
+    buf = bytearray(length)
+    view = memoryview(buf)
+    filled = 0
+    while filled < length:
+        count = resp.readinto(view[filled:])
+        if not count:
+            break
+        filled += count
+    view.release()
+    if filled < length:
+        del buf[filled:]
+    return buf
+
+
+def _http_post(url, data, headers, timeout_s):
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https") or urllib.request.getproxies().get(scheme):
+        # Proxies and exotic schemes keep going through urllib's handler chain.
+        req = urllib.request.Request(url, data=data, headers=headers)
+        context = _get_ssl_context() if scheme == "https" else None
+        with urllib.request.urlopen(req, timeout=timeout_s, context=context) as resp:
+            return resp.read()
+
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+
+    for attempt in range(2):
+        conn = _get_connection(scheme, parts.netloc, timeout_s)
+        reused = conn.sock is not None
+        try:
+            conn.request("POST", path, body=data, headers=headers)
+            resp = conn.getresponse()
+            body = _read_body(resp)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            _drop_connection(scheme, parts.netloc)
+            if reused and attempt == 0:
+                continue
+            raise
+        except Exception:
+            _drop_connection(scheme, parts.netloc)
+            raise
+        if resp.will_close:
+            _drop_connection(scheme, parts.netloc)
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        return body
+
+
+_OLLAMA_BODY = b'{"model":%s,"prompt":%s,"stream":false}'
+_OLLAMA_BODY_WITH_SYSTEM = b'{"model":%s,"system":%s,"prompt":%s,"stream":false}'
+_OPENAI_BODY = b'{"model":%s,"messages":[{"role":"user","content":%s}],"temperature":0}'
+_OPENAI_BODY_WITH_SYSTEM = (
+    b'{"model":%s,"messages":[{"role":"system","content":%s},'
+    b'{"role":"user","content":%s}],"temperature":0}'
+)
+
+# Request bodies have a fixed shape, so only the string fields are JSON-encoded per
+# call; the constant system prompt is encoded once here.
+_SYSTEM_PROMPT_JSON = _dumps(SYSTEM_PROMPT)
+
+
+def _encode_system(system):
+    if system is SYSTEM_PROMPT:
+        return _SYSTEM_PROMPT_JSON
+    return _dumps(system)
+
+
+def _build_ollama_body(model, prompt, system=None):
+    if not isinstance(model, str) or not isinstance(prompt, str):
+        payload = {"model": model, "prompt": prompt, "stream": False}
+        if system:
+            payload["system"] = system
+        return _dumps(payload)
+    if system:
+        return _OLLAMA_BODY_WITH_SYSTEM % (_dumps(model), _encode_system(system), _dumps(prompt))
+    return _OLLAMA_BODY % (_dumps(model), _dumps(prompt))
+
+
+def _build_openai_body(model, prompt, system=None):
+    if not isinstance(model, str) or not isinstance(prompt, str):
+        messages = [{"role": "user", "content": prompt}]
+        if system:
+            messages.insert(0, {"role": "system", "content": system})
+        return _dumps({"model": model, "messages": messages, "temperature": 0})
+    if system:
+        return _OPENAI_BODY_WITH_SYSTEM % (_dumps(model), _encode_system(system), _dumps(prompt))
+    return _OPENAI_BODY % (_dumps(model), _dumps(prompt))
+
+
+def _extract_ollama_text(parsed):
+    return parsed.get("response", "")
+
+
+def _extract_openai_text(parsed):
+    choices = parsed.get("choices") or []
+    if not choices:
+        return ""
+    return (choices[0].get("message") or {}).get("content", "")
+
+
+# provider -> (request body builder, response text extractor)
+_PROVIDERS = {
+    "ollama": (_build_ollama_body, _extract_ollama_text),
+    "openai": (_build_openai_body, _extract_openai_text),
+    "openai-compatible": (_build_openai_body, _extract_openai_text),
+}
+
+
+def call_llm(prompt, provider, base_url, model, timeout_s, api_key=None, system=None):
     headers = {"Content-Type": "application/json"}
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
 
-    if provider == "ollama":
-        payload = {
-            "model": model,
-            "prompt": prompt,
-            "stream": False,
-        }
-    elif provider in ["openai", "openai-compatible"]:
-        payload = {
-            "model": model,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0,
-        }
-    else:
+    try:
+        build_body, extract_text = _PROVIDERS[provider]
+    except (KeyError, TypeError):
         raise ValueError(f"unsupported_provider:{provider}")
 
-    data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(base_url, data=data, headers=headers)
+    data = build_body(model, prompt, system)
     start = time.time()
-    with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-        body = resp.read().decode("utf-8")
+    body = _http_post(base_url, data, headers, timeout_s)
     end = time.time()
-    parsed = json.loads(body)
+    parsed = _loads(body)
+    response_text = extract_text(parsed)
+    return response_text, parsed, end - start
 
-    if provider == "ollama":
-        response_text = parsed.get("response", "")
-    else:
-        choices = parsed.get("choices") or []
-        response_text = ""
-        if choices:
-            response_text = (choices[0].get("message") or {}).get("content", "")
 
-    return response_text, parsed, end - start
+_TOOL_CALL_KEYS = frozenset(("tool", "args", "safety"))
+_SAFETY_KEYS = frozenset(("requires_confirmation", "reason"))
+
+_ARG_RANGES = {
+    "canary_percent": (0, 100),
+    "replicas": (1, None),
+}
+
+
+def _compile_args_validator(spec):
+    required = tuple(spec["required"])
+    types = dict(spec["required"])
+    types.update(spec["optional"])
+    allowed = frozenset(types)
+    ranges = tuple(
+        (key, low, high) for key, (low, high) in _ARG_RANGES.items() if key in types
+    )
+
+    def validate(args):
+        for key in required:
+            if key not in args:
+                return f"schema_error: missing_required_arg:{key}"
+        if not allowed.issuperset(args):
+            for key in args:
+                if key not in allowed:
+                    return f"schema_error: unexpected_arg:{key}"
+        for key, val in args.items():
+            if not isinstance(val, types[key]):
+                return f"schema_error: arg_type:{key}"
+        for key, low, high in ranges:
+            if key in args:
+                val = args[key]
+                if (low is not None and val < low) or (high is not None and val > high):
+                    return f"schema_error: {key}_range"
+        return ""
+
+    return validate
+
+
+# Per-tool argument validators, built once from TOOL_SCHEMA.
+_ARG_VALIDATORS = {name: _compile_args_validator(spec) for name, spec in TOOL_SCHEMA.items()}
+
+
+def _extract_json_object(response_text):
+    if not isinstance(response_text, str):
+        return ""
+    text = response_text.lstrip()
+    if text.startswith("```"):
+        # Models sometimes wrap the object in a markdown code fence.
+        start = text.find("{")
+        end = text.rfind("}")
+        if start == -1 or end < start:
+            return ""
+        return text[start:end + 1]
+    return text
 
 
 def validate_tool_call(response_text):
+    text = _extract_json_object(response_text)
+    if not text or text[0] != "{":
+        return False, None, "invalid_json: not_object"
     try:
-        data = json.loads(response_text)
+        data = _loads(text)
     except Exception as exc:
         return False, None, f"invalid_json: {exc}"
 
     if not isinstance(data, dict):
         return False, None, "schema_error: root_not_object"
 
-    expected_keys = {"tool", "args", "safety"}
-    if set(data.keys()) != expected_keys:
+    if data.keys() != _TOOL_CALL_KEYS:
         return False, None, f"schema_error: keys={sorted(data.keys())}"
 
     tool = data.get("tool")
-    if tool not in TOOL_SCHEMA:
+    if not isinstance(tool, str) or tool not in _ARG_VALIDATORS:
         return False, None, f"tool_not_allowed: {tool!r}"
 
     args = data.get("args")
@@ -211,40 +573,53 @@ def validate_tool_call(response_text):
     if not isinstance(safety, dict):
         return False, None, "schema_error: safety_not_object"
 
-    safety_keys = {"requires_confirmation", "reason"}
-    if set(safety.keys()) != safety_keys:
+    if safety.keys() != _SAFETY_KEYS:
         return False, None, "schema_error: safety_keys"
     if not isinstance(safety["requires_confirmation"], bool):
         return False, None, "schema_error: requires_confirmation_not_bool"
     if not isinstance(safety["reason"], str):
         return False, None, "schema_error: reason_not_string"
 
-    required = TOOL_SCHEMA[tool]["required"]
-    optional = TOOL_SCHEMA[tool]["optional"]
-    allowed_args = set(required.keys()) | set(optional.keys())
+    error = _ARG_VALIDATORS[tool](args)
+    if error:
+        return False, None, error
+
+    return True, data, ""
+
+
+def _response_cache_key(provider, base_url, model, prompt):
+    raw = f"{provider}|{base_url}|{model}|{prompt}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
 
-    for key in required:
-        if key not in args:
-            return False, None, f"schema_error: missing_required_arg:{key}"
 
-    for key in args:
-        if key not in allowed_args:
-            return False, None, f"schema_error: unexpected_arg:{key}"
+def _get_cached_response(key):
+    if RESPONSE_CACHE_TTL_S <= 0:
+        return None
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, response_text, raw_response = entry
+        if time.time() - stored_at >= RESPONSE_CACHE_TTL_S:
+            del _RESPONSE_CACHE[key]
+            return None
+        _RESPONSE_CACHE.move_to_end(key)
+    return response_text, raw_response
 
-    for key, val in args.items():
-        expected_type = required.get(key) or optional.get(key)
-        if expected_type is not None and not isinstance(val, expected_type):
-            return False, None, f"schema_error: arg_type:{key}"
 
-    if "canary_percent" in args:
-        if not (0 <= args["canary_percent"] <= 100):
-            return False, None, "schema_error: canary_percent_range"
+def _store_cached_response(key, response_text, raw_response):
+    if RESPONSE_CACHE_TTL_S <= 0:
+        return
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[key] = (time.time(), response_text, raw_response)
+        _RESPONSE_CACHE.move_to_end(key)
+        while len(_RESPONSE_CACHE) > RESPONSE_CACHE_MAX_ENTRIES:
+            _RESPONSE_CACHE.popitem(last=False)
 
-    if "replicas" in args:
-        if args["replicas"] < 1:
-            return False, None, "schema_error: replicas_range"
 
-    return True, data, ""
+def clear_response_cache():
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
 
 
 def run_nl_request(request, provider=None, base_url=None, model=None, timeout_s=None, api_key=None):
@@ -255,10 +630,29 @@ def run_nl_request(request, provider=None, base_url=None, model=None, timeout_s=
         timeout_s=timeout_s,
         api_key=api_key,
     )
-    prompt = build_prompt(request)
+    system_prompt, user_prompt = build_prompt_parts(request)
+    cache_key = _response_cache_key(provider, base_url, model, system_prompt + user_prompt)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        response_text, raw_response = cached
+        ok, data, error = validate_tool_call(response_text)
+        return {
+            "ok": ok,
+            "data": data,
+            "error": error,
+            "raw": response_text,
+            "raw_response": raw_response,
+            "latency_s": 0.0,
+            "model": model,
+            "base_url": base_url,
+            "provider": provider,
+            "cached": True,
+        }
+
     try:
         response_text, raw_response, latency = call_llm(
-            prompt, provider, base_url, model, timeout_s, api_key=api_key
+            user_prompt, provider, base_url, model, timeout_s, api_key=api_key,
+            system=system_prompt,
         )
     except Exception as exc:
         return {
@@ -273,6 +667,8 @@ def run_nl_request(request, provider=None, base_url=None, model=None, timeout_s=
         }
 
     ok, data, error = validate_tool_call(response_text)
+    if ok:
+        _store_cached_response(cache_key, response_text, raw_response)
     return {
         "ok": ok,
         "data": data,
@@ -283,4 +679,29 @@ def run_nl_request(request, provider=None, base_url=None, model=None, timeout_s=
         "model": model,
         "base_url": base_url,
         "provider": provider,
+        "cached": False,
     }
+
+
+async def run_nl_request_async(request, provider=None, base_url=None, model=None, timeout_s=None,
+                               api_key=None):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(
+        run_nl_request,
+        request,
+        provider=provider,
+        base_url=base_url,
+        model=model,
+        timeout_s=timeout_s,
+        api_key=api_key,
+    ))
+
+
+async def run_nl_requests_batch(requests, concurrency=4, **kwargs):
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _guarded(request):
+        async with semaphore:
+            return await run_nl_request_async(request, **kwargs)
+
+    return await asyncio.gather(*[_guarded(request) for request in requests])
@@ -1,22 +1,44 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Header, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
+import asyncio
+import functools
 import os
 import json
 import subprocess
+import threading
 import hashlib
 import hmac
+from collections import deque
+from queue import Queue
 from urllib.parse import urlparse
 from datetime import datetime
 from typing import Optional, List, Dict
 import secrets
 from pydantic import BaseModel
 
+try:
+    from pydantic import ConfigDict
+except ImportError:  # pydantic v1
+    ConfigDict = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Try local imports first (when running as package)
 try:
     from .cli import (
         load_config,
+        atomic_write_bytes,
+        tail_lines,
+        ensure_data_dirs,
+        CONFIG_FILE,
+        AI_REQUESTS_FILE,
+        AI_REQUESTS_LOG,
         save_config,
         SCRIPTS_DIR,
         LOGS_DIR,
@@ -27,7 +49,8 @@ try:
         load_nodes,
         get_auth_token,
         load_ai_requests,
-        save_ai_requests,
+        append_ai_request,
+        store_ai_raw,
         execute_ai_action,
         log_ai_event,
     )
@@ -38,6 +61,12 @@ except ImportError:
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
     from cli import (
         load_config,
+        atomic_write_bytes,
+        tail_lines,
+        ensure_data_dirs,
+        CONFIG_FILE,
+        AI_REQUESTS_FILE,
+        AI_REQUESTS_LOG,
         save_config,
         SCRIPTS_DIR,
         LOGS_DIR,
@@ -48,7 +77,8 @@ except ImportError:
         load_nodes,
         get_auth_token,
         load_ai_requests,
-        save_ai_requests,
+        append_ai_request,
+        store_ai_raw,
         execute_ai_action,
         log_ai_event,
     )
@@ -67,43 +97,341 @@ app.add_middleware(
 
 WEBHOOK_DEDUPE_FILE = CONFIG_DIR / "webhook_dedupe.json"
 WEBHOOK_EVENTS_FILE = CONFIG_DIR / "webhook_events.jsonl"
+NODES_FILE = CONFIG_DIR / "nodes.json"
+DASHBOARD_AUTH_FILE = CONFIG_DIR / "dashboard_auth.json"
 
 
-def append_webhook_event(record):
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent=False):
+    """Serialize to UTF-8 bytes; indent=True matches json.dumps(indent=2)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+# Parsed state files keyed by (path, loader); an entry is reused while the file's
+# (mtime_ns, size) is unchanged, so writes from the CLI or scripts are picked up.
+_FILE_CACHE = {}
+_config_write_lock = threading.Lock()
+_ai_requests_write_lock = threading.Lock()
+
+# Decoded webhook secrets keyed by the value stored in pipeline.json.
+_webhook_secrets = {}
+
+
+def _file_stamp(paths):
+    stamp = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            stamp.append(None)
+        else:
+            stamp.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
+def _cached_load(path, loader, *also):
+    """Memoize loader() for `path`, also re-validating against any extra files in `also`."""
+    stamp = _file_stamp((path,) + also)
+    if not any(stamp):
+        return loader()
+    key = (str(path), loader.__name__)
+    entry = _FILE_CACHE.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    value = loader()
+    _FILE_CACHE[key] = (stamp, value)
+    return value
+
+
+def _prime_cache(value, path, loader, *also):
+    """Record `value` as the parse of files this process just wrote."""
+    stamp = _file_stamp((path,) + also)
+    if any(stamp):
+        _FILE_CACHE[(str(path), loader.__name__)] = (stamp, value)
+
+
+def cached_config():
+    """Read-only view of pipeline.json; use load_config() before mutating."""
+    return _cached_load(CONFIG_FILE, load_config)
+
+
+def update_pipeline(project_name, fields):
+    """Apply field updates to one pipeline with a single save.
+
+    Builds the new config from the cached parse (copying only the touched pipeline), so
+    a read-modify-write right after a webhook's own read does not re-parse the file.
+    """
+    with _config_write_lock:
+        current = cached_config()
+        if project_name not in current:
+            return False
+        config = dict(current)
+        config[project_name] = dict(current[project_name], **fields)
+        save_config(config)
+    return True
+
+
+def cached_nodes():
+    return _cached_load(NODES_FILE, load_nodes)
+
+
+def cached_ai_requests():
+    return _cached_load(AI_REQUESTS_FILE, load_ai_requests, AI_REQUESTS_LOG)
+
+
+def _ai_request_list():
+    return sorted(
+        cached_ai_requests().values(),
+        key=lambda record: record.get("created_at") or "",
+        reverse=True,
+    )
+
+
+def cached_ai_request_list():
+    """AI request records, newest first, rebuilt only when the store changes."""
+    return _cached_load(AI_REQUESTS_FILE, _ai_request_list, AI_REQUESTS_LOG)
+
+
+def update_ai_request(record):
+    """Journal one new or updated AI request and keep the cached views in step with it."""
+    with _ai_requests_write_lock:
+        requests = dict(cached_ai_requests())
+        requests[record["id"]] = record
+        append_ai_request(record)
+        _prime_cache(requests, AI_REQUESTS_FILE, load_ai_requests, AI_REQUESTS_LOG)
+
+
+WEBHOOK_DEDUPE_LIMIT = 1000
+
+# GitHub caps webhook payloads at 25 MB, so larger bodies cannot be legitimate deliveries.
+try:
+    WEBHOOK_MAX_BODY_BYTES = int(os.getenv("EEVEON_WEBHOOK_MAX_BYTES", str(25 * 1024 * 1024)))
+except ValueError:
+    WEBHOOK_MAX_BODY_BYTES = 25 * 1024 * 1024
+
+# Delivery ids seen recently: a bounded deque (on-disk order) plus a set for O(1)
+# lookups, loaded from WEBHOOK_DEDUPE_FILE on first use and flushed by the event writer.
+_dedupe_entries = None
+_dedupe_ids = None
+_dedupe_dirty = False
+
+WEBHOOK_EVENT_QUEUE_SIZE = 10000
+WEBHOOK_EVENT_BATCH_SIZE = 64
+WEBHOOK_EVENT_FLUSH_S = 0.05
+WEBHOOK_EVENT_FSYNC_S = 1.0
+
+# Created on startup; events are written by a single background task in batches.
+_webhook_event_queue = None
+_webhook_event_task = None
+
+
+def _open_webhook_events_fd():
     WEBHOOK_EVENTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(WEBHOOK_EVENTS_FILE, "a") as f:
-        f.write(json.dumps(record) + "\n")
+    return os.open(str(WEBHOOK_EVENTS_FILE), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
+def _write_webhook_events(records, dedupe_entries=None, fd=None, sync=False):
+    """Append records as JSON lines; `fd` is the writer's long-lived O_APPEND descriptor."""
+    if records:
+        blob = b"".join(_json_dumps(record) + b"\n" for record in records)
+        owned = fd is None
+        if owned:
+            fd = _open_webhook_events_fd()
+        try:
+            view = memoryview(blob)
+            while view:
+                view = view[os.write(fd, view):]
+            if sync:
+                os.fsync(fd)
+        finally:
+            if owned:
+                os.close(fd)
+    if dedupe_entries is not None:
+        save_webhook_dedupe(dedupe_entries)
+
+
+def append_webhook_event(record):
+    """Queue a webhook audit record. Must be called from the event loop thread."""
+    queue = _webhook_event_queue
+    if queue is not None:
+        try:
+            queue.put_nowait(record)
+            return
+        except asyncio.QueueFull:
+            pass
+    # No writer running (or it is saturated): write through synchronously.
+    _write_webhook_events([record])
+
+
+class WebhookEvent:
+    """Audit context for one webhook delivery; fields are recorded once they are set."""
+
+    _FIELDS = ("repo", "project", "branch")
+    __slots__ = ("timestamp", "delivery_id", "event") + _FIELDS
+
+    def __init__(self, delivery_id, event):
+        self.timestamp = datetime.now().isoformat()
+        self.delivery_id = delivery_id
+        self.event = event
+
+    def emit(self, status, **extra):
+        record = {"timestamp": self.timestamp, "delivery_id": self.delivery_id, "event": self.event}
+        for name in self._FIELDS:
+            if hasattr(self, name):
+                record[name] = getattr(self, name)
+        record.update(extra)
+        record["status"] = status
+        append_webhook_event(record)
+
+
+async def _webhook_event_writer(queue):
+    loop = asyncio.get_running_loop()
+    fd = await run_in_threadpool(_open_webhook_events_fd)
+    last_sync = loop.time()
+    try:
+        while True:
+            record = await queue.get()
+            if record is None:
+                return
+            batch = [record]
+            stop = False
+            deadline = loop.time() + WEBHOOK_EVENT_FLUSH_S
+            while len(batch) < WEBHOOK_EVENT_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    record = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if record is None:
+                    stop = True
+                    break
+                batch.append(record)
+            # Durability is amortised: fsync at most once per WEBHOOK_EVENT_FSYNC_S.
+            sync = loop.time() - last_sync >= WEBHOOK_EVENT_FSYNC_S
+            try:
+                await run_in_threadpool(
+                    _write_webhook_events, batch, _dedupe_snapshot(), fd, sync
+                )
+                if sync:
+                    last_sync = loop.time()
+            except Exception as e:
+                log(f"Failed to write webhook events: {e}", "ERROR")
+            if stop:
+                return
+    finally:
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        os.close(fd)
+
+
+@app.on_event("startup")
+def prepare_data_dirs():
+    ensure_data_dirs()
+
+
+@app.on_event("startup")
+async def start_webhook_event_writer():
+    global _webhook_event_queue, _webhook_event_task
+    _webhook_event_queue = asyncio.Queue(maxsize=WEBHOOK_EVENT_QUEUE_SIZE)
+    _webhook_event_task = asyncio.ensure_future(_webhook_event_writer(_webhook_event_queue))
+
+
+@app.on_event("shutdown")
+async def stop_webhook_event_writer():
+    global _webhook_event_queue, _webhook_event_task
+    queue, task = _webhook_event_queue, _webhook_event_task
+    _webhook_event_queue = None
+    _webhook_event_task = None
+    if queue is None or task is None:
+        return
+    await queue.put(None)
+    await task
+    entries = _dedupe_snapshot()
+    if entries is not None:
+        save_webhook_dedupe(entries)
 
 
 def load_webhook_dedupe():
     if not WEBHOOK_DEDUPE_FILE.exists():
         return []
     try:
-        return json.loads(WEBHOOK_DEDUPE_FILE.read_text())
-    except json.JSONDecodeError:
+        return _json_loads(WEBHOOK_DEDUPE_FILE.read_bytes())
+    except ValueError:
         return []
 
 
 def save_webhook_dedupe(entries):
     WEBHOOK_DEDUPE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    WEBHOOK_DEDUPE_FILE.write_text(json.dumps(entries[-1000:], indent=2) + "\n")
+    atomic_write_bytes(WEBHOOK_DEDUPE_FILE, _json_dumps(entries[-WEBHOOK_DEDUPE_LIMIT:]))
+
+
+def _load_dedupe_state():
+    global _dedupe_entries, _dedupe_ids
+    if _dedupe_entries is not None:
+        return
+    latest = {}
+    for entry in load_webhook_dedupe():
+        if isinstance(entry, dict) and entry.get("id"):
+            latest.pop(entry["id"], None)
+            latest[entry["id"]] = entry
+    _dedupe_entries = deque(latest.values(), maxlen=WEBHOOK_DEDUPE_LIMIT)
+    _dedupe_ids = {entry["id"] for entry in _dedupe_entries}
+
+
+def _dedupe_snapshot():
+    """Return the entries to persist if they changed since the last flush, else None."""
+    global _dedupe_dirty
+    if not _dedupe_dirty:
+        return None
+    _dedupe_dirty = False
+    return list(_dedupe_entries)
 
 
 def is_duplicate_delivery(delivery_id):
+    global _dedupe_dirty
     if not delivery_id:
         return False
-    entries = load_webhook_dedupe()
-    seen = {entry.get("id") for entry in entries if isinstance(entry, dict)}
-    if delivery_id in seen:
+    _load_dedupe_state()
+    if delivery_id in _dedupe_ids:
         return True
-    entries.append({"id": delivery_id, "ts": datetime.now().isoformat()})
-    save_webhook_dedupe(entries)
+    if len(_dedupe_entries) == _dedupe_entries.maxlen:
+        _dedupe_ids.discard(_dedupe_entries[0]["id"])
+    _dedupe_entries.append({"id": delivery_id, "ts": datetime.now().isoformat()})
+    _dedupe_ids.add(delivery_id)
+    _dedupe_dirty = True
+    if _webhook_event_queue is None:
+        save_webhook_dedupe(_dedupe_snapshot())
     return False
 
 
+_GITHUB_URL_PREFIXES = ("https://github.com/", "http://github.com/")
+
+
+@functools.lru_cache(maxsize=1024)
 def extract_repo_full_name(url):
     if not url:
         return None
+    # Fast path for plain GitHub URLs; anything with a query/fragment goes through urlparse.
+    if url.startswith(_GITHUB_URL_PREFIXES) and "?" not in url and "#" not in url:
+        path = url.split("/", 3)[3].lstrip("/")
+        if path.endswith(".git"):
+            path = path[:-4]
+        segments = path.split("/", 2)
+        if len(segments) >= 2:
+            return segments[0] + "/" + segments[1]
+        return None
     if url.startswith("git@"):
         parts = url.split(":", 1)
         if len(parts) == 2:
@@ -123,26 +451,57 @@ def extract_repo_full_name(url):
     return None
 
 
-def match_pipeline_for_repo(config, repo_full_name, clone_url, ssh_url):
-    for name, pipeline in config.items():
+def build_pipeline_index(config):
+    """Map webhook repo names and URLs to (position, pipeline name).
+
+    Position is the pipeline's order in config, so the smallest match reproduces the
+    first-match-wins behavior of scanning pipelines in order.
+    """
+    by_repo = {}
+    by_url = {}
+    for position, (name, pipeline) in enumerate(config.items()):
         enabled = pipeline.get("webhook_enabled")
         if enabled is False:
             continue
         if enabled is None and not (pipeline.get("webhook_repo") or pipeline.get("webhook_secret")):
             continue
+        entry = (position, name)
+        if pipeline.get("webhook_repo"):
+            by_repo.setdefault(pipeline["webhook_repo"].lower(), entry)
+        repo_url = pipeline.get("repo_url")
+        if repo_url:
+            by_url.setdefault(repo_url, entry)
+        repo_full = extract_repo_full_name(repo_url)
+        if repo_full:
+            by_repo.setdefault(repo_full.lower(), entry)
+    return by_repo, by_url
 
-        if pipeline.get("webhook_repo") and repo_full_name:
-            if pipeline["webhook_repo"].lower() == repo_full_name.lower():
-                return name
 
-        repo_url = pipeline.get("repo_url")
-        if repo_url and repo_url in [clone_url, ssh_url]:
-            return name
+_pipeline_index = (None, None)
 
-        repo_full = extract_repo_full_name(repo_url)
-        if repo_full and repo_full_name and repo_full.lower() == repo_full_name.lower():
-            return name
-    return None
+
+def _get_pipeline_index(config):
+    global _pipeline_index
+    indexed_config, index = _pipeline_index
+    if indexed_config is not config:
+        index = build_pipeline_index(config)
+        _pipeline_index = (config, index)
+    return index
+
+
+def match_pipeline_for_repo(config, repo_full_name, clone_url, ssh_url):
+    by_repo, by_url = _get_pipeline_index(config)
+    matches = []
+    if repo_full_name:
+        matches.append(by_repo.get(repo_full_name.lower()))
+    if clone_url:
+        matches.append(by_url.get(clone_url))
+    if ssh_url:
+        matches.append(by_url.get(ssh_url))
+    matches = [match for match in matches if match is not None]
+    if not matches:
+        return None
+    return min(matches)[1]
 
 
 def get_allowed_branches(pipeline):
@@ -157,11 +516,23 @@ def get_allowed_branches(pipeline):
 
 
 def get_webhook_secret(pipeline):
-    secret = pipeline.get("webhook_secret")
-    if not secret:
+    """Return the pipeline's webhook secret as bytes, memoized by its stored value."""
+    stored = pipeline.get("webhook_secret")
+    if not stored:
         return None
-    if secret.startswith("ENC:"):
-        return SecretsManager.decrypt("_system_", secret[4:])
+    secret = _webhook_secrets.get(stored)
+    if secret is not None:
+        return secret
+    if stored.startswith("ENC:"):
+        decrypted = SecretsManager.decrypt("_system_", stored[4:])
+        if not decrypted:
+            return None
+        secret = decrypted.encode()
+    else:
+        secret = stored.encode()
+    if len(_webhook_secrets) >= 64:
+        _webhook_secrets.clear()
+    _webhook_secrets[stored] = secret
     return secret
 
 
@@ -170,8 +541,13 @@ def verify_signature(secret, signature_header, payload_body):
         return True
     if not signature_header or not signature_header.startswith("sha256="):
         return False
-    expected = hmac.new(secret.encode(), payload_body, hashlib.sha256).hexdigest()
-    provided = signature_header.split("=", 1)[1]
+    if isinstance(secret, str):
+        secret = secret.encode()
+    try:
+        provided = bytes.fromhex(signature_header[7:])
+    except ValueError:
+        return False
+    expected = hmac.new(secret, payload_body, hashlib.sha256).digest()
     return hmac.compare_digest(expected, provided)
 
 
@@ -184,24 +560,91 @@ def run_deploy_and_update(project_name, commit_sha):
     if result.returncode != 0:
         log(f"Webhook deploy failed for {project_name}", "ERROR")
         return False
-    config = load_config()
-    if project_name in config:
-        config[project_name]["last_commit"] = commit_sha
-        config[project_name]["pending_commit"] = None
-        config[project_name]["approved_commit"] = None
-        config[project_name]["last_webhook_commit"] = commit_sha
-        save_config(config)
+    update_pipeline(project_name, {
+        "last_commit": commit_sha,
+        "pending_commit": None,
+        "approved_commit": None,
+        "last_webhook_commit": commit_sha,
+    })
     return True
 
+# notify.sh invocations are serialised through one daemon thread so request handlers never
+# fork, and a burst of identical notifications collapses into a single script run.
+_notify_queue = Queue()
+_notify_thread = None
+_notify_thread_lock = threading.Lock()
+
+
+def _notify_worker():
+    while True:
+        batch = [_notify_queue.get()]
+        while not _notify_queue.empty():
+            batch.append(_notify_queue.get_nowait())
+        for args in dict.fromkeys(batch):
+            notify_script = SCRIPTS_DIR / "notify.sh"
+            if not notify_script.exists():
+                continue
+            try:
+                subprocess.run(
+                    [str(notify_script), *args],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError as e:
+                log(f"Failed to run notify.sh: {e}", "ERROR")
+
+
+def queue_notification(project_name, status, message, commit_sha="", commit_msg=""):
+    """Hand a notification to the background notify.sh worker."""
+    global _notify_thread
+    # notify.sh exits immediately without a notifications config; skip the queue too.
+    if not (CONFIG_DIR / "notifications.json").exists():
+        return
+    if _notify_thread is None:
+        with _notify_thread_lock:
+            if _notify_thread is None:
+                _notify_thread = threading.Thread(
+                    target=_notify_worker, name="eeveon-notify", daemon=True
+                )
+                _notify_thread.start()
+    _notify_queue.put((project_name, status, message, commit_sha or "", commit_msg or ""))
+
+
+def mark_pending_approval(project_name, branch, commit_sha, commit_msg):
+    update_pipeline(project_name, {
+        "pending_commit": commit_sha,
+        "last_webhook_commit": commit_sha,
+    })
+    queue_notification(
+        project_name,
+        "warning",
+        f"Webhook commit awaiting approval on {branch}",
+        commit_sha,
+        commit_msg,
+    )
+
 # Security
 async def verify_token(x_eeveon_token: str = Header(None)):
-    expected = get_auth_token()
-    if not x_eeveon_token or x_eeveon_token != expected:
+    # One stat per request; the token file is only re-read after it is rotated.
+    expected = _cached_load(DASHBOARD_AUTH_FILE, get_auth_token)
+    if not x_eeveon_token or not expected or not hmac.compare_digest(
+        x_eeveon_token.encode(), expected.encode()
+    ):
         raise HTTPException(status_code=401, detail="Invalid or missing access token")
     return x_eeveon_token
 
 # Models
-class SiteConfig(BaseModel):
+class APIModel(BaseModel):
+    """Request body base: unknown keys are dropped, on both pydantic v1 and v2."""
+
+    if ConfigDict is not None:
+        model_config = ConfigDict(extra="ignore")
+    else:
+        class Config:
+            extra = "ignore"
+
+
+class SiteConfig(APIModel):
     name: str
     repo_url: str
     branch: str
@@ -210,19 +653,21 @@ class SiteConfig(BaseModel):
     approve: bool = False
     interval: int = 120
 
-class SecretInput(BaseModel):
+class SecretInput(APIModel):
     project: str
     key: str
     value: str
 
 # API Endpoints
+# Handlers that block (subprocesses, LLM calls, file writes) are plain `def` so FastAPI
+# runs them in its threadpool instead of on the event loop.
 @app.get("/api/config", dependencies=[Depends(verify_token)])
 async def get_full_config():
-    return load_config()
+    return cached_config()
 
 @app.get("/api/status", dependencies=[Depends(verify_token)])
 async def get_system_status():
-    config = load_config()
+    config = cached_config()
     sites = []
     
     for name, data in config.items():
@@ -236,7 +681,7 @@ async def get_system_status():
             "status": "active" if data.get("enabled", True) else "disabled"
         })
         
-    nodes = load_nodes()
+    nodes = cached_nodes()
     return {
         "home": str(EEVEON_HOME),
         "sites": sites,
@@ -244,7 +689,7 @@ async def get_system_status():
     }
 
 @app.post("/api/deploy/{project}", dependencies=[Depends(verify_token)])
-async def trigger_deploy(project: str):
+def trigger_deploy(project: str):
     log(f"API: Triggering deployment for {project}", "INFO")
     deploy_script = SCRIPTS_DIR / "deploy.sh"
     if not deploy_script.exists():
@@ -255,19 +700,22 @@ async def trigger_deploy(project: str):
     return {"message": f"Deployment triggered for {project}"}
 
 @app.post("/api/approve/{project}", dependencies=[Depends(verify_token)])
-async def approve_site(project: str):
+def approve_site(project: str):
     log(f"API: Approving pending commit for {project}", "SUCCESS")
-    config = load_config()
-    if project not in config:
-        raise HTTPException(status_code=404, detail="Project not found")
-        
-    pending = config[project].get('pending_commit')
-    if not pending:
-        raise HTTPException(status_code=400, detail="No pending deployment")
-        
-    config[project]['approved_commit'] = pending
-    config[project]['pending_commit'] = None
-    save_config(config)
+    # Read and update under the lock webhook threads write through, so a pending
+    # commit recorded in between is neither lost nor cleared unapproved
+    with _config_write_lock:
+        current = cached_config()
+        if project not in current:
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        pending = current[project].get('pending_commit')
+        if not pending:
+            raise HTTPException(status_code=400, detail="No pending deployment")
+
+        config = dict(current)
+        config[project] = dict(current[project], approved_commit=pending, pending_commit=None)
+        save_config(config)
     return {"message": f"Approved commit {pending[:7]}"}
 
 @app.get("/api/logs", dependencies=[Depends(verify_token)])
@@ -277,26 +725,33 @@ async def get_logs(lines: int = 100):
         return {"logs": []}
         
     try:
-        result = subprocess.run(["tail", "-n", str(lines), str(log_file)], capture_output=True, text=True)
-        return {"logs": result.stdout.splitlines()}
+        return {"logs": await run_in_threadpool(tail_lines, log_file, lines)}
     except Exception as e:
         return {"error": str(e)}
 
-class ChannelConfig(BaseModel):
+class ChannelConfig(APIModel):
     enabled: bool = False
     webhook_url: Optional[str] = None
     bot_token: Optional[str] = None
     chat_id: Optional[str] = None
     events: Dict[str, bool] = {"success": True, "failure": True, "warning": True, "info": True}
 
-class NotificationSettings(BaseModel):
+# (channel, field) pairs stored encrypted in notifications.json
+_ENCRYPTED_NOTIFICATION_FIELDS = (
+    ("slack", "webhook_url"),
+    ("teams", "webhook_url"),
+    ("discord", "webhook_url"),
+    ("telegram", "bot_token"),
+)
+
+class NotificationSettings(APIModel):
     slack: Optional[ChannelConfig] = None
     teams: Optional[ChannelConfig] = None
     discord: Optional[ChannelConfig] = None
     telegram: Optional[ChannelConfig] = None
 
 
-class AIParseRequest(BaseModel):
+class AIParseRequest(APIModel):
     request: str
     model: Optional[str] = None
     base_url: Optional[str] = None
@@ -305,7 +760,7 @@ class AIParseRequest(BaseModel):
     api_key: Optional[str] = None
 
 
-class AIRequestCreate(BaseModel):
+class AIRequestCreate(APIModel):
     request: str
     model: Optional[str] = None
     base_url: Optional[str] = None
@@ -315,7 +770,7 @@ class AIRequestCreate(BaseModel):
     auto_execute: bool = False
 
 
-class AIConfigUpdate(BaseModel):
+class AIConfigUpdate(APIModel):
     provider: Optional[str] = None
     base_url: Optional[str] = None
     model: Optional[str] = None
@@ -324,37 +779,50 @@ class AIConfigUpdate(BaseModel):
     api_key: Optional[str] = None
 
 @app.get("/api/notifications", dependencies=[Depends(verify_token)])
-async def get_notifications():
+def get_notifications():
     notify_file = CONFIG_DIR / "notifications.json"
     if not notify_file.exists():
         return {"slack_enabled": False, "teams_enabled": False}
-    with open(notify_file, 'r') as f:
-        return json.load(f)
+    return _json_loads(notify_file.read_bytes())
 
 @app.post("/api/notifications", dependencies=[Depends(verify_token)])
-async def update_notifications(settings: NotificationSettings):
+def update_notifications(settings: NotificationSettings):
     notify_file = CONFIG_DIR / "notifications.json"
     
     # We encrypt sensitive fields before saving
-    config = settings.dict()
-    
-    for channel in ["slack", "teams", "discord"]:
-        if config.get(channel) and config[channel].get("webhook_url"):
-            val = config[channel]["webhook_url"]
-            if val and not val.startswith("ENC:"):
-                config[channel]["webhook_url"] = "ENC:" + SecretsManager.encrypt("_system_", val)
-    
-    if config.get("telegram"):
-        if config["telegram"].get("bot_token"):
-            val = config["telegram"]["bot_token"]
-            if val and not val.startswith("ENC:"):
-                config["telegram"]["bot_token"] = "ENC:" + SecretsManager.encrypt("_system_", val)
-                
-    with open(notify_file, 'w') as f:
-        json.dump(config, f, indent=2)
+    if hasattr(settings, "model_dump"):
+        config = settings.model_dump(exclude_none=True)
+    else:
+        config = settings.dict(exclude_none=True)
+
+    for channel, field in _ENCRYPTED_NOTIFICATION_FIELDS:
+        section = config.get(channel)
+        val = section.get(field) if section else None
+        if val and not val.startswith("ENC:"):
+            section[field] = "ENC:" + SecretsManager.encrypt("_system_", val)
+
+    atomic_write_bytes(notify_file, _json_dumps(config, indent=True))
     return {"message": "Notifications updated successfully"}
 
 
+async def read_limited_body(request, limit):
+    """Read the request body, rejecting it with 413 once it exceeds `limit` bytes."""
+    content_length = request.headers.get("content-length")
+    if content_length:
+        try:
+            declared = int(content_length)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Content-Length")
+        if declared > limit:
+            raise HTTPException(status_code=413, detail="Payload too large")
+    buf = bytearray()
+    async for chunk in request.stream():
+        buf += chunk
+        if len(buf) > limit:
+            raise HTTPException(status_code=413, detail="Payload too large")
+    return bytes(buf)
+
+
 @app.post("/api/webhooks/github")
 async def github_webhook(
     request: Request,
@@ -363,63 +831,42 @@ async def github_webhook(
     x_github_event: str = Header(None),
     x_github_delivery: str = Header(None),
 ):
-    body = await request.body()
+    body = await read_limited_body(request, WEBHOOK_MAX_BODY_BYTES)
     try:
-        payload = json.loads(body.decode("utf-8"))
-    except json.JSONDecodeError:
+        payload = _json_loads(body)
+    except ValueError:
         raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
     if not x_github_event:
         raise HTTPException(status_code=400, detail="Missing X-GitHub-Event")
 
+    ctx = WebhookEvent(x_github_delivery, x_github_event)
+
     if is_duplicate_delivery(x_github_delivery):
-        append_webhook_event({
-            "timestamp": datetime.now().isoformat(),
-            "delivery_id": x_github_delivery,
-            "event": x_github_event,
-            "status": "duplicate",
-        })
+        ctx.emit("duplicate")
         return {"status": "duplicate"}
 
     repo = payload.get("repository", {})
     repo_full_name = repo.get("full_name")
+    ctx.repo = repo_full_name
     clone_url = repo.get("clone_url")
     ssh_url = repo.get("ssh_url")
-    config = load_config()
+    config = await run_in_threadpool(cached_config)
     project = match_pipeline_for_repo(config, repo_full_name, clone_url, ssh_url)
 
     if not project:
-        append_webhook_event({
-            "timestamp": datetime.now().isoformat(),
-            "delivery_id": x_github_delivery,
-            "event": x_github_event,
-            "repo": repo_full_name,
-            "status": "ignored_no_match",
-        })
+        ctx.emit("ignored_no_match")
         return {"status": "ignored_no_match"}
 
+    ctx.project = project
     pipeline = config.get(project, {})
-    secret = get_webhook_secret(pipeline)
+    secret = await run_in_threadpool(get_webhook_secret, pipeline)
     if not verify_signature(secret, x_hub_signature_256, body):
-        append_webhook_event({
-            "timestamp": datetime.now().isoformat(),
-            "delivery_id": x_github_delivery,
-            "event": x_github_event,
-            "repo": repo_full_name,
-            "project": project,
-            "status": "invalid_signature",
-        })
+        ctx.emit("invalid_signature")
         raise HTTPException(status_code=401, detail="Invalid signature")
 
     if x_github_event == "ping":
-        append_webhook_event({
-            "timestamp": datetime.now().isoformat(),
-            "delivery_id": x_github_delivery,
-            "event": x_github_event,
-            "repo": repo_full_name,
-            "project": project,
-            "status": "pong",
-        })
+        ctx.emit("pong")
         return {"status": "pong"}
 
     branch = None
@@ -429,14 +876,7 @@ async def github_webhook(
 
     if x_github_event == "push":
         if payload.get("deleted"):
-            append_webhook_event({
-                "timestamp": datetime.now().isoformat(),
-                "delivery_id": x_github_delivery,
-                "event": x_github_event,
-                "repo": repo_full_name,
-                "project": project,
-                "status": "ignored_deleted_ref",
-            })
+            ctx.emit("ignored_deleted_ref")
             return {"status": "ignored_deleted_ref"}
         ref = payload.get("ref", "")
         branch = ref.split("/")[-1] if ref else None
@@ -445,98 +885,39 @@ async def github_webhook(
         commit_msg = head_commit.get("message", "")
     elif x_github_event == "release":
         if action not in ["published", "released"]:
-            append_webhook_event({
-                "timestamp": datetime.now().isoformat(),
-                "delivery_id": x_github_delivery,
-                "event": x_github_event,
-                "repo": repo_full_name,
-                "project": project,
-                "status": f"ignored_action:{action}",
-            })
+            ctx.emit(f"ignored_action:{action}")
             return {"status": "ignored_action"}
         release = payload.get("release") or {}
         branch = release.get("target_commitish")
         commit_sha = release.get("tag_name") or ""
         commit_msg = release.get("name") or "release"
     else:
-        append_webhook_event({
-            "timestamp": datetime.now().isoformat(),
-            "delivery_id": x_github_delivery,
-            "event": x_github_event,
-            "repo": repo_full_name,
-            "project": project,
-            "status": "ignored_event",
-        })
+        ctx.emit("ignored_event")
         return {"status": "ignored_event"}
 
+    ctx.branch = branch
     allowed_branches = get_allowed_branches(pipeline)
     if allowed_branches and branch not in allowed_branches:
-        append_webhook_event({
-            "timestamp": datetime.now().isoformat(),
-            "delivery_id": x_github_delivery,
-            "event": x_github_event,
-            "repo": repo_full_name,
-            "project": project,
-            "branch": branch,
-            "status": "ignored_branch",
-        })
+        ctx.emit("ignored_branch")
         return {"status": "ignored_branch"}
 
     if pipeline.get("enabled") is False:
-        append_webhook_event({
-            "timestamp": datetime.now().isoformat(),
-            "delivery_id": x_github_delivery,
-            "event": x_github_event,
-            "repo": repo_full_name,
-            "project": project,
-            "branch": branch,
-            "status": "ignored_paused",
-        })
+        ctx.emit("ignored_paused")
         return {"status": "ignored_paused"}
 
     if pipeline.get("approval_required"):
-        config[project]["pending_commit"] = commit_sha
-        config[project]["last_webhook_commit"] = commit_sha
-        save_config(config)
-        notify_script = SCRIPTS_DIR / "notify.sh"
-        if notify_script.exists():
-            subprocess.Popen([
-                str(notify_script),
-                project,
-                "warning",
-                f"Webhook commit awaiting approval on {branch}",
-                commit_sha or "",
-                commit_msg,
-            ])
-        append_webhook_event({
-            "timestamp": datetime.now().isoformat(),
-            "delivery_id": x_github_delivery,
-            "event": x_github_event,
-            "repo": repo_full_name,
-            "project": project,
-            "branch": branch,
-            "commit": commit_sha,
-            "status": "pending_approval",
-        })
+        await run_in_threadpool(mark_pending_approval, project, branch, commit_sha, commit_msg)
+        ctx.emit("pending_approval", commit=commit_sha)
         return {"status": "pending_approval"}
 
-    append_webhook_event({
-        "timestamp": datetime.now().isoformat(),
-        "delivery_id": x_github_delivery,
-        "event": x_github_event,
-        "repo": repo_full_name,
-        "project": project,
-        "branch": branch,
-        "commit": commit_sha,
-        "status": "deploy_started",
-    })
+    ctx.emit("deploy_started", commit=commit_sha)
 
     background_tasks.add_task(run_deploy_and_update, project, commit_sha or "")
     return {"status": "deploy_started", "project": project}
 
 
 @app.post("/api/ai/parse", dependencies=[Depends(verify_token)])
-async def ai_parse(payload: AIParseRequest):
+def ai_parse(payload: AIParseRequest):
     result = run_nl_request(
         payload.request,
         provider=payload.provider,
@@ -562,7 +943,7 @@ async def get_ai_config():
 
 
 @app.post("/api/ai/config", dependencies=[Depends(verify_token)])
-async def update_ai_config(payload: AIConfigUpdate):
+def update_ai_config(payload: AIConfigUpdate):
     config = load_ai_config()
     if payload.provider is not None:
         config["provider"] = payload.provider
@@ -586,7 +967,7 @@ async def update_ai_config(payload: AIConfigUpdate):
 
 
 @app.post("/api/ai/request", dependencies=[Depends(verify_token)])
-async def ai_request(payload: AIRequestCreate):
+def ai_request(payload: AIRequestCreate):
     result = run_nl_request(
         payload.request,
         provider=payload.provider,
@@ -601,13 +982,11 @@ async def ai_request(payload: AIRequestCreate):
             "raw": result["raw"],
         })
 
-    requests = load_ai_requests()
     request_id = f"ai-{secrets.token_hex(4)}"
     record = {
         "id": request_id,
         "request": payload.request,
         "tool_call": result["data"],
-        "raw": result["raw"],
         "status": "pending",
         "created_at": datetime.now().isoformat(),
         "created_by": "api",
@@ -615,6 +994,7 @@ async def ai_request(payload: AIRequestCreate):
         "executed_at": None,
         "error": None,
     }
+    store_ai_raw(record, result["raw"])
 
     log_ai_event(
         "ai_request_created",
@@ -629,8 +1009,7 @@ async def ai_request(payload: AIRequestCreate):
 
     if auto_execute and not result["data"]["safety"].get("requires_confirmation"):
         ok, message = execute_ai_action(result["data"], approved=True)
-        record["approved_at"] = datetime.now().isoformat()
-        record["executed_at"] = datetime.now().isoformat()
+        record["approved_at"] = record["executed_at"] = datetime.now().isoformat()
         record["status"] = "executed" if ok else "failed"
         record["error"] = None if ok else message
         log_ai_event(
@@ -642,23 +1021,21 @@ async def ai_request(payload: AIRequestCreate):
             detail=message,
         )
 
-    requests[request_id] = record
-    save_ai_requests(requests)
+    update_ai_request(record)
     return record
 
 
 @app.get("/api/ai/requests", dependencies=[Depends(verify_token)])
 async def list_ai_requests():
-    requests = load_ai_requests()
-    return list(requests.values())
+    return cached_ai_request_list()
 
 
 @app.post("/api/ai/approve/{request_id}", dependencies=[Depends(verify_token)])
-async def approve_ai_request(request_id: str):
-    requests = load_ai_requests()
-    record = requests.get(request_id)
+def approve_ai_request(request_id: str):
+    record = cached_ai_requests().get(request_id)
     if not record:
         raise HTTPException(status_code=404, detail="AI request not found")
+    record = dict(record)
     if record.get("status") in ["executed", "failed"]:
         raise HTTPException(status_code=400, detail="AI request already completed")
 
@@ -671,12 +1048,10 @@ async def approve_ai_request(request_id: str):
     )
 
     ok, message = execute_ai_action(record["tool_call"], approved=True)
-    record["approved_at"] = datetime.now().isoformat()
-    record["executed_at"] = datetime.now().isoformat()
+    record["approved_at"] = record["executed_at"] = datetime.now().isoformat()
     record["status"] = "executed" if ok else "failed"
     record["error"] = None if ok else message
-    requests[request_id] = record
-    save_ai_requests(requests)
+    update_ai_request(record)
     log_ai_event(
         "ai_request_executed",
         request_id=request_id,
@@ -690,7 +1065,7 @@ async def approve_ai_request(request_id: str):
     return record
 
 @app.post("/api/rollback/{project}", dependencies=[Depends(verify_token)])
-async def rollback_project(project: str):
+def rollback_project(project: str):
     log(f"API: Rollback command received for {project}", "WARNING")
     config = load_config()
     if project not in config:
@@ -703,45 +1078,70 @@ async def rollback_project(project: str):
     return {"message": f"Rollback initiated for {project}"}
 
 @app.delete("/api/remove/{project}", dependencies=[Depends(verify_token)])
-async def remove_project(project: str):
+def remove_project(project: str):
     log(f"API: Removing project {project} from configuration", "WARNING")
-    config = load_config()
-    if project in config:
-        del config[project]
-        save_config(config)
-        return {"message": f"Project {project} removed"}
+    with _config_write_lock:
+        config = load_config()
+        if project in config:
+            del config[project]
+            save_config(config)
+            return {"message": f"Project {project} removed"}
     raise HTTPException(status_code=404, detail="Project not found")
 
+# ConnectTimeout only bounds the handshake; the outer timeout also covers a hung session.
+NODE_CHECK_TIMEOUT_S = 10
+
+
+async def _probe_node(node_id, node):
+    """SSH into a node without blocking the event loop; returns active/offline."""
+    try:
+        cmd = [
+            "ssh", "-o", "ConnectTimeout=3", "-o", "BatchMode=yes",
+            f"{node['user']}@{node['ip']}", "exit",
+        ]
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+        )
+    except Exception:
+        return {"status": "offline", "id": node_id}
+    try:
+        returncode = await asyncio.wait_for(proc.wait(), NODE_CHECK_TIMEOUT_S)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        returncode = None
+    status = "active" if returncode == 0 else "offline"
+    return {"status": status, "id": node_id}
+
+
+@app.get("/api/nodes/check_all", dependencies=[Depends(verify_token)])
+async def check_all_nodes():
+    """Probe every node concurrently, so the check takes the slowest node's time, not the sum"""
+    if not NODES_FILE.exists():
+        return {"status": "error", "message": "No nodes configured"}
+    nodes = await run_in_threadpool(cached_nodes)
+    log(f"API: Checking connectivity for {len(nodes)} nodes", "INFO")
+    results = await asyncio.gather(*(_probe_node(node_id, node) for node_id, node in nodes.items()))
+    return {result["id"]: result["status"] for result in results}
+
+
 @app.get("/api/nodes/check/{node_id}", dependencies=[Depends(verify_token)])
 async def check_node_health(node_id: str):
-    nodes_file = CONFIG_DIR / "nodes.json"
-    if not nodes_file.exists():
+    if not NODES_FILE.exists():
         return {"status": "error", "message": "No nodes configured"}
-    
-    with open(nodes_file, 'r') as f:
-        nodes = json.load(f)
-    
+
+    nodes = await run_in_threadpool(cached_nodes)
+
     if node_id not in nodes:
         return {"status": "error", "message": "Node not found"}
         
     node = nodes[node_id]
-    log(f"API: Checking connectivity for node {node_id} ({node['ip']})", "INFO")
-    try:
-        # Quick SSH check
-        cmd = ["ssh", "-o", "ConnectTimeout=3", "-o", "BatchMode=yes", f"{node['user']}@{node['ip']}", "exit"]
-        res = subprocess.run(cmd, capture_output=True)
-        status = "active" if res.returncode == 0 else "offline"
-        return {"status": status, "id": node_id}
-    except:
-        return {"status": "offline", "id": node_id}
+    log(f"API: Checking connectivity for node {node_id} ({node.get('ip')})", "INFO")
+    return await _probe_node(node_id, node)
         
 @app.get("/api/nodes", dependencies=[Depends(verify_token)])
 async def get_nodes():
-    nodes_file = CONFIG_DIR / "nodes.json"
-    if not nodes_file.exists():
-        return {}
-    with open(nodes_file, 'r') as f:
-        return json.load(f)
+    return cached_nodes()
 
 # Static files and frontend
 DASHBOARD_DIR = Path(__file__).parent / "dashboard"
@@ -5,29 +5,64 @@ Manages continuous deployment from GitHub to production server
 """
 
 import os
+import sys
 import json
+import functools
 import subprocess
 import shutil
 import argparse
+import atexit
+import contextlib
+import fcntl
+import queue
 import secrets
+import shlex
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from cryptography.fernet import Fernet
 
 START_TIME = datetime.now()
+
+
+@functools.lru_cache(maxsize=1)
+def _rich():
+    """(console, Text) on first styled output, or None without rich; list/logs never pay for it"""
+    try:
+        from rich.console import Console
+        from rich.text import Text
+    except ImportError:
+        return None
+    return Console(), Text
+
+
+def _have_rich():
+    return _rich() is not None
+
 try:
-    from rich.console import Console
-    from rich.logging import RichHandler
-    from rich.live import Live
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.layout import Layout
-    from rich.text import Text
-    import logging
-    RICH_AVAILABLE = True
-    console = Console()
+    import orjson
 except ImportError:
-    RICH_AVAILABLE = False
+    orjson = None
+
+
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent=False):
+    """Serialize to UTF-8 bytes; indent=True matches json.dumps(indent=2)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _print_json(obj):
+    """Pretty-print a JSON document to stdout"""
+    print(_json_dumps(obj, indent=True).decode("utf-8"))
 
 # Configuration and Data paths (Use user's home directory for portability)
 EEVEON_HOME = Path.home() / ".eeveon"
@@ -36,27 +71,75 @@ LOGS_DIR = EEVEON_HOME / "logs"
 DEPLOYMENTS_DIR = EEVEON_HOME / "deployments"
 KEYS_DIR = EEVEON_HOME / "keys"
 AI_REQUESTS_FILE = CONFIG_DIR / "ai_requests.json"
+AI_REQUESTS_LOG = CONFIG_DIR / "ai_requests.jsonl"
 AI_AUDIT_FILE = CONFIG_DIR / "ai_audit.jsonl"
+AI_RAW_DIR = CONFIG_DIR / "ai_raw"
 
 # Package paths (where scripts are located)
 PACKAGE_DIR = Path(__file__).parent
 SCRIPTS_DIR = PACKAGE_DIR / "scripts"
 
-# Ensure data directories exist
-for dir_path in [CONFIG_DIR, LOGS_DIR, DEPLOYMENTS_DIR, KEYS_DIR]:
-    dir_path.mkdir(parents=True, exist_ok=True)
+# Data directories are created on first write (see ensure_data_dirs), not at import,
+# so `--help`, completion and library imports cost no filesystem calls
+_data_dirs_ready = False
+
+
+def ensure_data_dirs():
+    """Create the ~/.eeveon data directories once per process"""
+    global _data_dirs_ready
+    if _data_dirs_ready:
+        return
+    for dir_path in [CONFIG_DIR, LOGS_DIR, DEPLOYMENTS_DIR, KEYS_DIR]:
+        dir_path.mkdir(parents=True, exist_ok=True)
+    _data_dirs_ready = True
 
 CONFIG_FILE = CONFIG_DIR / "pipeline.json"
 AUTH_FILE = CONFIG_DIR / "auth.json"
 GLOBAL_FILE = CONFIG_DIR / "global.json"
+NODES_FILE = CONFIG_DIR / "nodes.json"
 ENV_FILE = CONFIG_DIR / ".env"
 
 
+# Parsed state files keyed by path; an entry is reused while the file's (mtime_ns, size)
+# is unchanged, so one command that consults a file several times parses it once.
+_STATE_CACHE = {}
+
+
+def _read_json_cached(path):
+    """Parse a JSON state file through _STATE_CACHE; raises FileNotFoundError if absent"""
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    entry = _STATE_CACHE.get(str(path))
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    with open(path, 'rb') as f:
+        value = _json_loads(f.read())
+    _STATE_CACHE[str(path)] = (stamp, value)
+    return value
+
+
+def _remember_json(path, value):
+    """Record `value` as the parse of a state file this process just wrote"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return
+    _STATE_CACHE[str(path)] = ((st.st_mtime_ns, st.st_size), value)
+
+
+def _copy_pipelines(config):
+    # Callers mutate pipelines in place before save_config(), so never hand out cached dicts
+    return {
+        name: dict(pipeline) if isinstance(pipeline, dict) else pipeline
+        for name, pipeline in config.items()
+    }
+
+
 def get_global_config():
-    if not GLOBAL_FILE.exists():
+    try:
+        return dict(_read_json_cached(GLOBAL_FILE))
+    except FileNotFoundError:
         return {"log_retention_days": 7, "admin_user": os.getenv('USER')}
-    with open(GLOBAL_FILE, 'r') as f:
-        return json.load(f)
 
 
 def check_dependencies(args):
@@ -73,8 +156,7 @@ def check_dependencies(args):
     all_ok = True
     
     for dep, desc in deps.items():
-        result = subprocess.run(f"command -v {dep}", shell=True, capture_output=True)
-        if result.returncode == 0:
+        if shutil.which(dep):
             print(f"  {Colors.GREEN}[PASS] {dep.ljust(10)}{Colors.END} {desc}")
         else:
             if dep == "age":
@@ -103,46 +185,49 @@ def rotate_logs(args):
     log(f"Cleaning up logs older than {retention} days...", "INFO")
     
     count = 0
-    now = datetime.now()
-    for log_file in LOGS_DIR.glob("*.log"):
-        mtime = datetime.fromtimestamp(log_file.stat().st_mtime)
-        if (now - mtime).days > retention:
-            log_file.unlink()
-            count += 1
+    # Older than `retention` whole days, i.e. at least retention + 1 days of age
+    cutoff = time.time() - (retention + 1) * 86400
+    with os.scandir(LOGS_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith(".log") and entry.is_file() and entry.stat().st_mtime <= cutoff:
+                os.unlink(entry.path)
+                count += 1
             
     log(f"Removed {count} old log files", "SUCCESS")
+    if compact_ai_requests():
+        log("Compacted AI request journal", "INFO")
+
 
+# Each role includes everything the lower ones may do; unknown roles rank as viewer
+_ROLE_RANK = {"viewer": 0, "deployer": 1, "admin": 2}
 
-def has_permission(required_role="deployer"):
+
+def has_permission(required_role="deployer", global_config=None):
     """Check if the current user has the required permission level"""
     current_user = os.getenv('USER')
-    admin_user = get_global_config().get("admin_user")
+    if global_config is None:
+        global_config = get_global_config()
+    admin_user = global_config.get("admin_user")
     
     if current_user == admin_user:
         return True
         
-    if not AUTH_FILE.exists():
+    try:
+        auth_data = _read_json_cached(AUTH_FILE)
+    except FileNotFoundError:
         return False
         
-    with open(AUTH_FILE, 'r') as f:
-        auth_data = json.load(f)
-        
     user_data = auth_data.get(current_user)
     if not user_data:
         return False
-        
-    role = user_data.get("role")
-    if required_role == "admin":
-        return role == "admin"
-    if required_role == "deployer":
-        return role in ["admin", "deployer"]
-    
-    return True
+
+    return _ROLE_RANK.get(user_data.get("role"), 0) >= _ROLE_RANK.get(required_role, 0)
 
 
 def verify_admin():
-    if not has_permission("admin"):
-        admin_user = get_global_config().get("admin_user")
+    global_config = get_global_config()
+    if not has_permission("admin", global_config):
+        admin_user = global_config.get("admin_user")
         log(f"Permission Denied: Admin role required (Global Admin: {admin_user})", "ERROR")
         return False
     return True
@@ -159,15 +244,17 @@ def manage_auth(args):
     """Manage user permissions and roles"""
     if not verify_admin(): return
     
-    auth_data = {}
-    if AUTH_FILE.exists():
-        with open(AUTH_FILE, 'r') as f:
-            auth_data = json.load(f)
+    try:
+        # verify_admin() usually parsed auth.json already; reuse that parse
+        auth_data = dict(_read_json_cached(AUTH_FILE))
+    except FileNotFoundError:
+        auth_data = {}
 
     if args.action == 'add':
         auth_data[args.user] = {"role": args.role or "deployer", "added_at": datetime.now().isoformat()}
-        with open(AUTH_FILE, 'w') as f:
-            json.dump(auth_data, f, indent=2)
+        ensure_data_dirs()
+        with open(AUTH_FILE, 'wb') as f:
+            f.write(_json_dumps(auth_data, indent=True))
         log(f"User '{args.user}' added as {args.role or 'deployer'}", "SUCCESS")
         
     elif args.action == 'list':
@@ -222,15 +309,19 @@ def manage_webhook(args):
         log("Unknown webhook action", "ERROR")
         return
 
-    config[project_name] = pipeline
+    # `pipeline` is config's own dict, so one save covers whichever branch ran
     save_config(config)
 class SecretsManager:
     """Handles encryption and decryption of secrets using Fernet"""
-    
+
+    _ciphers = {}
+
     @staticmethod
     def get_key(project_name):
         key_file = KEYS_DIR / f"{project_name}.key"
         if not key_file.exists():
+            from cryptography.fernet import Fernet
+            ensure_data_dirs()
             key = Fernet.generate_key()
             with open(key_file, 'wb') as f:
                 f.write(key)
@@ -238,17 +329,50 @@ class SecretsManager:
         with open(key_file, 'rb') as f:
             return f.read()
 
+    @staticmethod
+    def key_stamp(project_name):
+        """(inode, mtime_ns, size) of a project's key file, or None before it exists"""
+        try:
+            st = (KEYS_DIR / f"{project_name}.key").stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def cipher(cls, project_name):
+        """Fernet for a project's key, rebuilt only when the key file changes"""
+        stamp = cls.key_stamp(project_name)
+        cached = cls._ciphers.get(project_name)
+        if cached is None or stamp is None or cached[0] != stamp:
+            from cryptography.fernet import Fernet
+            f = Fernet(cls.get_key(project_name))
+            cls._ciphers[project_name] = (cls.key_stamp(project_name), f)
+            return f
+        return cached[1]
+
     @classmethod
     def encrypt(cls, project_name, value):
-        f = Fernet(cls.get_key(project_name))
+        f = cls.cipher(project_name)
         return f.encrypt(value.encode()).decode()
 
+    @classmethod
+    def decrypt_bytes(cls, project_name, token):
+        """Decrypt a str or bytes token to bytes, or None if it does not verify"""
+        if isinstance(token, str):
+            token = token.encode()
+        try:
+            return cls.cipher(project_name).decrypt(token)
+        except Exception:
+            return None
+
     @classmethod
     def decrypt(cls, project_name, encrypted_value):
-        f = Fernet(cls.get_key(project_name))
+        value = cls.decrypt_bytes(project_name, encrypted_value)
+        if value is None:
+            return None
         try:
-            return f.decrypt(encrypted_value.encode()).decode()
-        except:
+            return value.decode()
+        except UnicodeDecodeError:
             return None
 
 
@@ -268,53 +392,132 @@ def manage_system(args):
     """Handle system-level security/ops"""
     if args.action == 'decrypt':
         val = args.value
+        dec = None
         if val.startswith("ENC:"):
-            dec = SecretsManager.decrypt("_system_", val[4:])
-            if dec:
-                print(dec, end='')
-            else:
-                print(val, end='')
+            dec = SecretsManager.decrypt_bytes("_system_", val[4:].encode())
+        if dec:
+            sys.stdout.buffer.write(dec)
         else:
-            print(val, end='')
+            sys.stdout.write(val)
 
 
 def load_nodes():
     """Load remote nodes configuration"""
-    nodes_file = CONFIG_DIR / "nodes.json"
-    if nodes_file.exists():
-        with open(nodes_file, 'r') as f:
-            try:
-                return json.load(f)
-            except:
-                return {}
-    return {}
+    try:
+        return _copy_pipelines(_read_json_cached(NODES_FILE))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_nodes(nodes_data):
+    """Save remote nodes configuration"""
+    ensure_data_dirs()
+    atomic_write_bytes(NODES_FILE, _json_dumps(nodes_data, indent=True))
+    _remember_json(NODES_FILE, _copy_pipelines(nodes_data))
+
+
+# Formatted wall-clock strings for the current second: (epoch_s, date, time, iso)
+_clock = (None, "", "", "")
+
+
+def _clock_strings():
+    """Return (date, time, iso) for now, formatting at most once per second"""
+    global _clock
+    second = int(time.time())
+    cached = _clock
+    if cached[0] != second:
+        local = time.localtime(second)
+        date = time.strftime("%Y-%m-%d", local)
+        clock = time.strftime("%H:%M:%S", local)
+        cached = _clock = (second, date, clock, f"{date}T{clock}")
+    return cached[1:]
+
+
+# Today's deploy log, kept open (line-buffered, append mode) until the date rolls over
+_log_file = None
+_log_file_date = None
+_log_file_lock = threading.Lock()
+
+
+def _write_log_line(today, line):
+    global _log_file, _log_file_date
+    with _log_file_lock:
+        if _log_file_date != today or _log_file is None:
+            if _log_file is not None:
+                _log_file.close()
+            # Only the log directory; a command that merely logs should not create the rest
+            LOGS_DIR.mkdir(parents=True, exist_ok=True)
+            _log_file = open(LOGS_DIR / f"deploy-{today}.log", 'a', buffering=1)
+            _log_file_date = today
+        _log_file.write(line)
+
+
+_RICH_LEVEL_STYLES = {
+    "INFO": "bold cyan",
+    "SUCCESS": "bold green",
+    "WARNING": "bold yellow",
+    "ERROR": "bold red",
+}
+_ANSI_LEVEL_COLORS = {
+    "INFO": Colors.CYAN,
+    "SUCCESS": Colors.GREEN,
+    "WARNING": Colors.YELLOW,
+    "ERROR": Colors.RED,
+}
 
 
 def log(message, level="INFO"):
     """Log message with timestamp"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
+    today, timestamp, _ = _clock_strings()
     
-    if RICH_AVAILABLE:
-        color = {
-            "INFO": "cyan",
-            "SUCCESS": "green",
-            "WARNING": "yellow",
-            "ERROR": "red"
-        }.get(level, "cyan")
-        console.print(f"[bold {color}][{timestamp}] [{level}][/bold {color}] {message}")
+    if not sys.stdout.isatty():
+        # Pipes, CI and the systemd journal get plain lines with no styling to render
+        print(f"[{timestamp}] [{level}] {message}")
+    elif _have_rich():
+        # A pre-styled Text skips markup parsing (and keeps brackets in messages literal)
+        console, Text = _rich()
+        color = _RICH_LEVEL_STYLES.get(level, "bold cyan")
+        console.print(Text.assemble((f"[{timestamp}] [{level}]", color), " ", message))
     else:
-        color = {
-            "INFO": Colors.CYAN,
-            "SUCCESS": Colors.GREEN,
-            "WARNING": Colors.YELLOW,
-            "ERROR": Colors.RED
-        }.get(level, Colors.CYAN)
+        color = _ANSI_LEVEL_COLORS.get(level, Colors.CYAN)
         print(f"{color}[{timestamp}] [{level}]{Colors.END} {message}")
     
     # Also log to file
-    log_file = LOGS_DIR / f"deploy-{datetime.now().strftime('%Y-%m-%d')}.log"
-    with open(log_file, 'a') as f:
-        f.write(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [{level}] {message}\n")
+    _write_log_line(today, f"[{today} {timestamp}] [{level}] {message}\n")
+
+
+def tail_lines(path, count, block_size=8192, contains=None):
+    """Return the last `count` lines of a text file (optionally only those containing
+    `contains`), reading backwards from the end"""
+    if count <= 0:
+        return []
+    needle = contains.encode('utf-8') if contains else None
+    found = []
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        partial = b''
+        at_end = True
+        while position > 0 and len(found) < count:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            pieces = (f.read(step) + partial).split(b'\n')
+            # The first piece may continue into the previous block
+            partial = pieces[0]
+            complete = pieces[1:]
+            if at_end and complete and not complete[-1]:
+                complete.pop()
+            at_end = False
+            for line in reversed(complete):
+                if needle is None or needle in line:
+                    found.append(line)
+        if position == 0 and len(found) < count and not at_end:
+            if needle is None or needle in partial:
+                found.append(partial)
+    found = found[:count]
+    found.reverse()
+    return [line.rstrip(b'\r').decode('utf-8', errors='replace') for line in found]
 
 
 def run_command(command, cwd=None, capture=True):
@@ -339,14 +542,42 @@ def run_command(command, cwd=None, capture=True):
         return None
 
 
+def atomic_write_bytes(path, data, durable=False):
+    """Write a file via a sibling temp file and os.replace so readers never see a partial write;
+    durable=True also fsyncs the data and the directory entry before returning"""
+    path = str(path)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        try:
+            shutil.copymode(path, tmp_path)
+        except OSError:
+            pass
+        os.replace(tmp_path, path)
+        if durable:
+            dir_fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def load_config():
     """Load pipeline configuration"""
-    if not CONFIG_FILE.exists():
-        return {}
-    
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
+        return _copy_pipelines(_read_json_cached(CONFIG_FILE))
+    except FileNotFoundError:
+        return {}
     except json.JSONDecodeError:
         log("Invalid config file, creating new one", "WARNING")
         return {}
@@ -354,11 +585,26 @@ def load_config():
 
 def save_config(config):
     """Save pipeline configuration"""
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    ensure_data_dirs()
+    # pipeline.json is the one file a lost write cannot be recovered from, so make it durable
+    atomic_write_bytes(CONFIG_FILE, _json_dumps(config, indent=True), durable=True)
+    _remember_json(CONFIG_FILE, _copy_pipelines(config))
     log("Configuration saved", "SUCCESS")
 
 
+def update_project_config(project_name, fields=None, remove=()):
+    """Patch one pipeline against the current pipeline.json and save it in a single write"""
+    config = load_config()
+    pipeline = config.get(project_name)
+    if pipeline is None:
+        return False
+    pipeline.update(fields or {})
+    for key in remove:
+        pipeline.pop(key, None)
+    save_config(config)
+    return True
+
+
 def init_pipeline(args):
     """Initialize a new deployment pipeline"""
     if not verify_admin(): return
@@ -437,8 +683,8 @@ def set_config(args):
         health_file = CONFIG_DIR / "health_checks.json"
         health_config = {}
         if health_file.exists():
-            with open(health_file, 'r') as f:
-                try: health_config = json.load(f)
+            with open(health_file, 'rb') as f:
+                try: health_config = _json_loads(f.read())
                 except: health_config = {}
         
         if project_name not in health_config:
@@ -456,8 +702,8 @@ def set_config(args):
         elif value.lower() == 'false': value = False
         
         health_config[project_name][real_key] = value
-        with open(health_file, 'w') as f:
-            json.dump(health_config, f, indent=2)
+        with open(health_file, 'wb') as f:
+            f.write(_json_dumps(health_config, indent=True))
         log(f"Updated health config: {key} to {value}", "SUCCESS")
         return
 
@@ -557,7 +803,14 @@ def stop_pipeline(args):
     log(f"Stopping pipeline '{project_name}'...", "INFO")
     
     # Stop systemd service if running
-    result = run_command(f"sudo systemctl stop eeveon-{project_name} 2>/dev/null")
+    command = ["sudo", "systemctl", "stop", f"eeveon-{project_name}"]
+    try:
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        failed = result.returncode != 0
+    except OSError:
+        failed = True
+    if failed:
+        log(f"Command failed: {' '.join(command)}", "ERROR")
     log(f"Pipeline '{project_name}' stopped", "SUCCESS")
 
 
@@ -574,8 +827,8 @@ def manage_secrets(args):
     secrets_file = Path(config[project_name]['deployment_dir']) / "secrets.json"
     secrets = {}
     if secrets_file.exists():
-        with open(secrets_file, 'r') as f:
-            secrets = json.load(f)
+        with open(secrets_file, 'rb') as f:
+            secrets = _json_loads(f.read())
 
     if args.action == 'set':
         if not args.key or not args.value:
@@ -583,8 +836,8 @@ def manage_secrets(args):
             return
         encrypted_val = SecretsManager.encrypt(project_name, args.value)
         secrets[args.key] = encrypted_val
-        with open(secrets_file, 'w') as f:
-            json.dump(secrets, f, indent=2)
+        with open(secrets_file, 'wb') as f:
+            f.write(_json_dumps(secrets, indent=True))
         log(f"Secret '{args.key}' set and encrypted successfully", "SUCCESS")
     
     elif args.action == 'list':
@@ -599,8 +852,8 @@ def manage_secrets(args):
     elif args.action == 'remove':
         if args.key in secrets:
             del secrets[args.key]
-            with open(secrets_file, 'w') as f:
-                json.dump(secrets, f, indent=2)
+            with open(secrets_file, 'wb') as f:
+                f.write(_json_dumps(secrets, indent=True))
             log(f"Secret '{args.key}' removed", "SUCCESS")
         else:
             log(f"Secret '{args.key}' not found", "ERROR")
@@ -618,12 +871,19 @@ def decrypt_env(args):
     if not secrets_file.exists():
         return
 
-    with open(secrets_file, 'r') as f:
-        secrets = json.load(f)
-        for k, v in secrets.items():
-            decrypted = SecretsManager.decrypt(project_name, v)
-            if decrypted:
-                print(f"{k}={decrypted}")
+    with open(secrets_file, 'rb') as f:
+        secrets = _json_loads(f.read())
+
+    # Values stay bytes from Fernet to stdout; one write for the whole block
+    lines = []
+    for k, v in secrets.items():
+        decrypted = SecretsManager.decrypt_bytes(project_name, v.encode())
+        if decrypted:
+            lines.append(b"%s=%s\n" % (k.encode(), decrypted))
+    if lines:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(b"".join(lines))
+        sys.stdout.buffer.flush()
 
 
 def approve_deployment(args):
@@ -694,34 +954,215 @@ def show_logs(args):
         log("No logs found for today", "WARNING")
         return
     
-    if project_name:
-        # Filter logs for specific project
-        result = run_command(f"grep '{project_name}' {log_file} | tail -n {lines}")
-    else:
-        result = run_command(f"tail -n {lines} {log_file}")
-    
+    # Filter logs for a specific project when one is given
+    result = tail_lines(log_file, lines, contains=project_name)
     if result:
-        print(result)
+        print("\n".join(result))
+
+
+# AI requests live in a JSON snapshot plus an append-only journal of upserts that is
+# replayed over it on load; the journal is folded back into the snapshot once it
+# outgrows the snapshot by AI_REQUESTS_COMPACT_RATIO, or passes AI_REQUESTS_COMPACT_MAX_BYTES
+# so replay cost on load stays bounded however large the snapshot gets.
+AI_REQUESTS_COMPACT_RATIO = 10
+AI_REQUESTS_COMPACT_MIN_BYTES = 64 * 1024
+AI_REQUESTS_COMPACT_MAX_BYTES = 1024 * 1024
 
 
 def load_ai_requests():
-    if not AI_REQUESTS_FILE.exists():
-        return {}
+    requests = {}
+    if AI_REQUESTS_FILE.exists():
+        try:
+            with open(AI_REQUESTS_FILE, 'rb') as f:
+                requests = _json_loads(f.read())
+        except json.JSONDecodeError:
+            requests = {}
+    if AI_REQUESTS_LOG.exists():
+        with open(AI_REQUESTS_LOG, 'rb') as f:
+            for line in f:
+                try:
+                    entry = _json_loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from an interrupted append
+                    continue
+                if entry.get("op") == "upsert":
+                    requests[entry["id"]] = entry["record"]
+    return requests
+
+
+@contextlib.contextmanager
+def _locked_ai_journal():
+    """Open the AI request journal under an exclusive flock shared by appends and compaction"""
+    ensure_data_dirs()
+    while True:
+        f = open(AI_REQUESTS_LOG, 'a+b')
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                current = os.stat(AI_REQUESTS_LOG)
+            except FileNotFoundError:
+                current = None
+        except BaseException:
+            f.close()
+            raise
+        if current is not None and os.path.samestat(os.fstat(f.fileno()), current):
+            break
+        # Compaction unlinked the journal while we waited for the lock; lock the new one
+        f.close()
     try:
-        with open(AI_REQUESTS_FILE, 'r') as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        return {}
+        yield f
+    finally:
+        f.close()
 
 
 def save_ai_requests(requests):
-    with open(AI_REQUESTS_FILE, 'w') as f:
-        json.dump(requests, f, indent=2)
+    """Write a full snapshot and drop the journal it supersedes"""
+    with _locked_ai_journal():
+        atomic_write_bytes(AI_REQUESTS_FILE, _json_dumps(requests, indent=True))
+        os.unlink(AI_REQUESTS_LOG)
+
+
+def append_ai_request(*records):
+    """Persist new or updated AI requests by appending them to the journal in one write"""
+    if not records:
+        return
+    data = b"".join(
+        _json_dumps({"op": "upsert", "id": record["id"], "record": record}) + b"\n"
+        for record in records
+    )
+    with _locked_ai_journal() as f:
+        end = f.seek(0, os.SEEK_END)
+        if end:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                # Terminate a torn line from an interrupted append so this record stays readable
+                data = b"\n" + data
+        f.write(data)
+        journal_size = f.tell()
+    try:
+        snapshot_size = AI_REQUESTS_FILE.stat().st_size
+    except FileNotFoundError:
+        snapshot_size = 0
+    limit = min(
+        max(snapshot_size * AI_REQUESTS_COMPACT_RATIO, AI_REQUESTS_COMPACT_MIN_BYTES),
+        AI_REQUESTS_COMPACT_MAX_BYTES,
+    )
+    if journal_size > limit:
+        compact_ai_requests()
+
+
+def compact_ai_requests():
+    """Fold the AI request journal into the snapshot; returns False if there was nothing to fold"""
+    if not AI_REQUESTS_LOG.exists():
+        return False
+    with _locked_ai_journal():
+        # Load under the lock so an append from another process cannot land between
+        # the load and the unlink
+        atomic_write_bytes(AI_REQUESTS_FILE, _json_dumps(load_ai_requests(), indent=True))
+        os.unlink(AI_REQUESTS_LOG)
+    return True
+
+
+def store_ai_raw(record, raw):
+    """Save an LLM response under AI_RAW_DIR and point the record at it"""
+    # Responses can run to many KB; keeping them out of the request store keeps
+    # every load of the snapshot and journal small
+    if not raw:
+        record["raw_path"] = None
+        return record
+    AI_RAW_DIR.mkdir(parents=True, exist_ok=True)
+    raw_path = AI_RAW_DIR / f"{record['id']}.txt"
+    raw_path.write_text(raw, encoding="utf-8")
+    record["raw_path"] = str(raw_path)
+    return record
+
+
+class _PendingAIRequests:
+    """AI request upserts held until flush(); repeated upserts of one id collapse into
+    its latest state, so queue-then-execute in one command costs a single journal write"""
+
+    BATCH_SIZE = 50
+
+    def __init__(self):
+        self._records = {}
+        self._lock = threading.Lock()
+        self._registered = False
+
+    def upsert(self, record):
+        with self._lock:
+            self._records[record["id"]] = record
+            if not self._registered:
+                atexit.register(self.flush)
+                self._registered = True
+            if len(self._records) < self.BATCH_SIZE:
+                return
+        self.flush()
+
+    def flush(self):
+        with self._lock:
+            records, self._records = list(self._records.values()), {}
+        append_ai_request(*records)
+
+
+_pending_ai_requests = _PendingAIRequests()
+
+
+# Audit records are queued and appended by one background writer, which drains whatever
+# has accumulated into a single write(); callers never wait on the audit file. The queue
+# is bounded so a stalled disk applies backpressure instead of growing without limit.
+AI_AUDIT_QUEUE_SIZE = 1024
+_ai_audit_queue = queue.Queue(maxsize=AI_AUDIT_QUEUE_SIZE)
+_ai_audit_thread = None
+_ai_audit_lock = threading.Lock()
+
+
+AI_AUDIT_FLUSH_TIMEOUT_S = 5.0
+
+
+def _ai_audit_worker():
+    f = None
+    while True:
+        batch = [_ai_audit_queue.get()]
+        while True:
+            try:
+                batch.append(_ai_audit_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            if f is None:
+                ensure_data_dirs()
+                f = open(AI_AUDIT_FILE, 'ab', buffering=0)
+            f.write(b"".join(batch))
+        except OSError as e:
+            print(f"Failed to write AI audit log: {e}", file=sys.stderr)
+            # Reopen on the next batch in case the file was moved or fixed
+            if f is not None:
+                f.close()
+                f = None
+        finally:
+            for _ in batch:
+                _ai_audit_queue.task_done()
+
+
+def flush_ai_events(timeout=AI_AUDIT_FLUSH_TIMEOUT_S):
+    """Wait up to `timeout` seconds for queued audit records to be written; returns False on timeout"""
+    if _ai_audit_thread is None:
+        return True
+    deadline = time.monotonic() + timeout
+    with _ai_audit_queue.all_tasks_done:
+        while _ai_audit_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print("Timed out flushing AI audit log", file=sys.stderr)
+                return False
+            _ai_audit_queue.all_tasks_done.wait(remaining)
+    return True
 
 
 def log_ai_event(event, request_id=None, tool=None, status=None, actor=None, detail=None):
+    global _ai_audit_thread
     record = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _clock_strings()[2],
         "event": event,
         "request_id": request_id,
         "tool": tool,
@@ -729,9 +1170,20 @@ def log_ai_event(event, request_id=None, tool=None, status=None, actor=None, det
         "actor": actor,
         "detail": detail,
     }
-    AI_AUDIT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(AI_AUDIT_FILE, 'a') as f:
-        f.write(json.dumps(record) + "\n")
+    if _ai_audit_thread is None:
+        with _ai_audit_lock:
+            if _ai_audit_thread is None:
+                _ai_audit_thread = threading.Thread(
+                    target=_ai_audit_worker, name="eeveon-ai-audit", daemon=True
+                )
+                _ai_audit_thread.start()
+                atexit.register(flush_ai_events)
+    _ai_audit_queue.put(_json_dumps(record) + b"\n")
+
+
+@functools.lru_cache(maxsize=8)
+def _lowered_project_names(names):
+    return tuple((name.lower(), name) for name in names)
 
 
 def resolve_project_name(config, identifier):
@@ -739,9 +1191,11 @@ def resolve_project_name(config, identifier):
         return None, "missing_identifier"
     if identifier in config:
         return identifier, ""
+    # A suffix match is also a substring match, so one containment test covers both
+    needle = identifier.lower()
     matches = [
-        name for name in config.keys()
-        if identifier.lower() in name.lower() or name.lower().endswith(identifier.lower())
+        name for lowered, name in _lowered_project_names(tuple(config))
+        if needle in lowered
     ]
     if len(matches) == 1:
         return matches[0], ""
@@ -771,9 +1225,15 @@ def resolve_compose_path(pipeline):
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def _which(tool):
+    """shutil.which, remembered for the life of the process"""
+    return shutil.which(tool)
+
+
 def run_docker_compose(args, cwd):
-    docker_bin = shutil.which("docker")
-    docker_compose_bin = shutil.which("docker-compose")
+    docker_bin = _which("docker")
+    docker_compose_bin = _which("docker-compose")
     if docker_bin:
         result = subprocess.run(["docker", "compose"] + args, cwd=cwd)
         if result.returncode == 0:
@@ -850,11 +1310,14 @@ def execute_ai_action(tool_call, approved=False):
         if result.returncode != 0:
             return False, f"docker_compose_failed:{result.returncode}"
 
-        config[project]["desired_replicas"] = args.get("replicas")
-        config[project]["desired_replicas_updated_at"] = datetime.now().isoformat()
+        # docker compose can run for a while; patch the on-disk config as it is now
+        fields = {
+            "desired_replicas": args.get("replicas"),
+            "desired_replicas_updated_at": datetime.now().isoformat(),
+        }
         if args.get("region"):
-            config[project]["desired_replicas_region"] = args.get("region")
-        save_config(config)
+            fields["desired_replicas_region"] = args.get("region")
+        update_project_config(project, fields)
         log(f"Docker scale applied for '{project}' to {args.get('replicas')} replicas", "SUCCESS")
         return True, f"scale_applied:{project}"
 
@@ -862,10 +1325,11 @@ def execute_ai_action(tool_call, approved=False):
         project, error = resolve_project_name(config, args.get("service") or args.get("environment"))
         if not project:
             return False, f"pause_project_resolution_failed:{error}"
-        config[project]["enabled"] = False
-        config[project]["paused_at"] = datetime.now().isoformat()
-        config[project]["paused_reason"] = "ai_request"
-        save_config(config)
+        update_project_config(project, {
+            "enabled": False,
+            "paused_at": datetime.now().isoformat(),
+            "paused_reason": "ai_request",
+        })
         log(f"Automation paused for '{project}'", "WARNING")
         return True, f"automation_paused:{project}"
 
@@ -873,10 +1337,7 @@ def execute_ai_action(tool_call, approved=False):
         project, error = resolve_project_name(config, args.get("service") or args.get("environment"))
         if not project:
             return False, f"resume_project_resolution_failed:{error}"
-        config[project]["enabled"] = True
-        config[project].pop("paused_at", None)
-        config[project].pop("paused_reason", None)
-        save_config(config)
+        update_project_config(project, {"enabled": True}, remove=("paused_at", "paused_reason"))
         log(f"Automation resumed for '{project}'", "SUCCESS")
         return True, f"automation_resumed:{project}"
 
@@ -926,7 +1387,7 @@ def ai_assist(args):
     if args.raw:
         print(result["raw"])
     else:
-        print(json.dumps(result["data"], indent=2))
+        _print_json(result["data"])
     log(f"AI response validated in {result['latency_s']:.2f}s", "SUCCESS")
     return 0
 
@@ -936,6 +1397,7 @@ def ai_request(args):
     if not verify_deployer():
         return 1
 
+    user = os.getenv("USER")
     request = " ".join(args.request).strip() if args.request else ""
     if not request:
         log("Usage: ee-deploy ai-request \"<request>\"", "ERROR")
@@ -948,7 +1410,7 @@ def ai_request(args):
         log_ai_event(
             "ai_request_failed",
             status="failed",
-            actor=os.getenv("USER"),
+            actor=user,
             detail=f"ai_module_unavailable:{exc}",
         )
         return 1
@@ -967,37 +1429,35 @@ def ai_request(args):
         log_ai_event(
             "ai_request_failed",
             status="failed",
-            actor=os.getenv("USER"),
+            actor=user,
             detail=result["error"],
         )
         if args.raw:
             print(result["raw"])
         return 1
 
-    requests = load_ai_requests()
     request_id = f"ai-{secrets.token_hex(4)}"
     record = {
         "id": request_id,
         "request": request,
         "tool_call": result["data"],
-        "raw": result["raw"],
         "status": "pending",
         "created_at": datetime.now().isoformat(),
-        "created_by": os.getenv("USER"),
+        "created_by": user,
         "approved_at": None,
         "executed_at": None,
         "error": None,
     }
+    store_ai_raw(record, result["raw"])
 
-    requests[request_id] = record
-    save_ai_requests(requests)
+    _pending_ai_requests.upsert(record)
     log(f"AI request queued: {request_id}", "INFO")
     log_ai_event(
         "ai_request_created",
         request_id=request_id,
         tool=record["tool_call"].get("tool"),
         status="pending",
-        actor=os.getenv("USER"),
+        actor=user,
     )
 
     try:
@@ -1010,18 +1470,16 @@ def ai_request(args):
 
     if auto_execute and not result["data"]["safety"].get("requires_confirmation"):
         ok, message = execute_ai_action(result["data"], approved=True)
-        record["approved_at"] = datetime.now().isoformat()
-        record["executed_at"] = datetime.now().isoformat()
+        record["approved_at"] = record["executed_at"] = datetime.now().isoformat()
         record["status"] = "executed" if ok else "failed"
         record["error"] = None if ok else message
-        requests[request_id] = record
-        save_ai_requests(requests)
+        _pending_ai_requests.upsert(record)
         log_ai_event(
             "ai_request_executed",
             request_id=request_id,
             tool=record["tool_call"].get("tool"),
             status="success" if ok else "failed",
-            actor=os.getenv("USER"),
+            actor=user,
             detail=message,
         )
         if ok:
@@ -1030,11 +1488,13 @@ def ai_request(args):
             log(f"AI execution failed: {message}", "ERROR")
     elif auto_execute:
         log("AI request requires confirmation; use ai-approve", "WARNING")
+    # One journal write for the request's queued and (if run) executed states
+    _pending_ai_requests.flush()
 
     if args.raw:
         print(result["raw"])
     else:
-        print(json.dumps(result["data"], indent=2))
+        _print_json(result["data"])
     if auto_execute and not result["data"]["safety"].get("requires_confirmation") and not ok:
         return 1
     return 0
@@ -1046,17 +1506,25 @@ def ai_list(args):
     if not requests:
         log("No AI requests found", "WARNING")
         return
-    for request_id, record in requests.items():
+    # Requests keep creation order through journal replay, so the newest are at the end
+    request_ids = list(requests)
+    if args.limit:
+        request_ids = request_ids[-args.limit:]
+    lines = []
+    for request_id in reversed(request_ids):
+        record = requests[request_id]
         tool = record.get("tool_call", {}).get("tool", "unknown")
         status = record.get("status", "unknown")
         created = record.get("created_at", "n/a")
-        print(f"{request_id}  {status}  {tool}  {created}")
+        lines.append(f"{request_id}  {status}  {tool}  {created}\n")
+    sys.stdout.write("".join(lines))
 
 
 def ai_approve(args):
     """Approve and execute a pending AI request."""
     if not verify_deployer():
         return
+    user = os.getenv("USER")
     requests = load_ai_requests()
     record = requests.get(args.request_id)
     if not record:
@@ -1071,22 +1539,20 @@ def ai_approve(args):
         request_id=args.request_id,
         tool=record.get("tool_call", {}).get("tool"),
         status="approved",
-        actor=os.getenv("USER"),
+        actor=user,
     )
 
     ok, message = execute_ai_action(record["tool_call"], approved=True)
-    record["approved_at"] = datetime.now().isoformat()
-    record["executed_at"] = datetime.now().isoformat()
+    record["approved_at"] = record["executed_at"] = datetime.now().isoformat()
     record["status"] = "executed" if ok else "failed"
     record["error"] = None if ok else message
-    requests[args.request_id] = record
-    save_ai_requests(requests)
+    append_ai_request(record)
     log_ai_event(
         "ai_request_executed",
         request_id=args.request_id,
         tool=record.get("tool_call", {}).get("tool"),
         status="success" if ok else "failed",
-        actor=os.getenv("USER"),
+        actor=user,
         detail=message,
     )
 
@@ -1109,7 +1575,7 @@ def ai_config(args):
         display = config.copy()
         if display.get("api_key"):
             display["api_key"] = "***"
-        print(json.dumps(display, indent=2))
+        _print_json(display)
         return
 
     updated = config.copy()
@@ -1139,7 +1605,28 @@ def ai_config(args):
 
     saved = save_ai_config(updated)
     log("AI configuration updated", "SUCCESS")
-    print(json.dumps(saved, indent=2))
+    _print_json(saved)
+
+
+@functools.lru_cache(maxsize=1)
+def _have_reflink_cp():
+    """True when cp understands --reflink (GNU coreutils)"""
+    if not shutil.which("cp"):
+        return False
+    probe = subprocess.run(["cp", "--reflink=auto", "--version"],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return probe.returncode == 0
+
+
+def _copy_tree(src, dst):
+    """Copy the contents of src into dst and return the copy's exit code"""
+    # On Btrfs/XFS, --reflink=auto shares extents instead of copying data, and it
+    # degrades to a plain copy elsewhere; rsync covers cp without --reflink (BSD/macOS)
+    if _have_reflink_cp():
+        result = subprocess.run(["cp", "-a", "--reflink=auto", f"{src}/.", f"{dst}/"])
+        if result.returncode == 0 or not shutil.which("rsync"):
+            return result.returncode
+    return subprocess.run(["rsync", "-a", f"{src}/", f"{dst}/"]).returncode
 
 
 def seed_rollback(args):
@@ -1163,10 +1650,8 @@ def seed_rollback(args):
     backup_dir = deployment_dir / "backups"
     history_file = deployment_dir / "deployment_history.json"
     backup_dir.mkdir(parents=True, exist_ok=True)
-    if not history_file.exists():
-        history_file.write_text("[]\n")
 
-    if not shutil.which("rsync"):
+    if not shutil.which("rsync") and not _have_reflink_cp():
         log("rsync is required for seeding rollback history", "ERROR")
         return
 
@@ -1176,14 +1661,14 @@ def seed_rollback(args):
     backup_path.mkdir(parents=True, exist_ok=True)
 
     log(f"Seeding rollback history for '{project_name}' from {target_path}", "INFO")
-    result = subprocess.run(["rsync", "-a", f"{target_path}/", f"{backup_path}/"])
-    if result.returncode != 0:
-        log(f"Seed backup failed with code {result.returncode}", "ERROR")
+    returncode = _copy_tree(target_path, backup_path)
+    if returncode != 0:
+        log(f"Seed backup failed with code {returncode}", "ERROR")
         return
 
     try:
-        history = json.loads(history_file.read_text())
-    except json.JSONDecodeError:
+        history = _json_loads(history_file.read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError):
         history = []
 
     entry = {
@@ -1203,12 +1688,19 @@ def seed_rollback(args):
         history = history[-keep:]
         removed_versions = [item.get("version") for item in removed if item.get("version")]
 
-    history_file.write_text(json.dumps(history, indent=2) + "\n")
+    # deploy.sh and rollback.sh jq this file, so it stays a JSON array (capped at `keep`)
+    # and is swapped in whole rather than rewritten in place
+    atomic_write_bytes(history_file, _json_dumps(history, indent=True) + b"\n")
 
-    for version_id in removed_versions:
-        old_path = backup_dir / version_id
-        if old_path.exists():
-            shutil.rmtree(old_path, ignore_errors=True)
+    old_paths = [backup_dir / version_id for version_id in removed_versions]
+    old_paths = [path for path in old_paths if path.exists()]
+    if len(old_paths) == 1:
+        shutil.rmtree(old_paths[0], ignore_errors=True)
+    elif old_paths:
+        # rmtree is syscall-bound, so a few trees can be unlinked side by side
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(4, len(old_paths))) as pool:
+            list(pool.map(functools.partial(shutil.rmtree, ignore_errors=True), old_paths))
 
     log(f"Rollback history seeded as {version}", "SUCCESS")
 
@@ -1216,16 +1708,44 @@ def seed_rollback(args):
 def get_auth_token():
     """Load or generate dashboard access token"""
     auth_file = CONFIG_DIR / "dashboard_auth.json"
-    if auth_file.exists():
-        with open(auth_file, 'r') as f:
-            return json.load(f).get("token")
-    
+    try:
+        with open(auth_file, 'rb') as f:
+            return _json_loads(f.read()).get("token")
+    except FileNotFoundError:
+        pass
+
     token = secrets.token_hex(16)
-    with open(auth_file, 'w') as f:
-        json.dump({"token": token}, f)
+    ensure_data_dirs()
+    # Write the token to a private temp file and link it into place: link() fails if
+    # another process got there first, so concurrent launches agree on one token and
+    # no reader ever sees an empty or partial file
+    tmp_path = f"{auth_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_json_dumps({"token": token}))
+        try:
+            os.link(tmp_path, auth_file)
+        except FileExistsError:
+            raise
+        except OSError:
+            # Filesystems without hard links: last writer wins, but still atomically
+            os.replace(tmp_path, auth_file)
+    except FileExistsError:
+        with open(auth_file, 'rb') as f:
+            return _json_loads(f.read()).get("token")
+    finally:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
     return token
 
 
+# psutil reads /proc/meminfo; the status panel refreshes the figure at most this often
+DASHBOARD_MEMORY_REFRESH_S = 5.0
+
+
 def launch_dashboard(args):
     """Launch the web management dashboard"""
     token = get_auth_token()
@@ -1243,10 +1763,11 @@ def launch_dashboard(args):
     log(f"Access Token: {token}", "WARNING")
     log(f"Direct Login: http://{host}:{port}/?token={token}", "SUCCESS")
     
-    if RICH_AVAILABLE:
-        import threading
-        import time
-        
+    if _have_rich():
+        from rich.live import Live
+        from rich.panel import Panel
+        from rich.table import Table
+
         def run_server():
             # Use warning level to hide initial startup spam
             uvicorn.run(app, host=host, port=port, access_log=False, log_level="warning")
@@ -1256,9 +1777,32 @@ def launch_dashboard(args):
 
         log(f"EEveon Engine is running at http://{host}:{port}", "SUCCESS")
         
+        # Use psutil if available, otherwise dummy
+        try:
+            import psutil
+        except ImportError:
+            psutil = None
+
+        status = {"stamps": None, "counts": (0, 0), "mem_ts": 0.0, "mem": "N/A"}
+
+        def file_stamp(path):
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+            return (st.st_mtime_ns, st.st_size)
+
         def get_status_table():
-            config = load_config()
-            nodes_data = load_nodes()
+            # Two stat() calls per tick; the JSON files are only re-read when they change
+            stamps = (file_stamp(CONFIG_FILE), file_stamp(NODES_FILE))
+            if stamps != status["stamps"]:
+                status["counts"] = (len(load_config()), len(load_nodes()))
+                status["stamps"] = stamps
+            now = time.monotonic()
+            if psutil is not None and now - status["mem_ts"] >= DASHBOARD_MEMORY_REFRESH_S:
+                status["mem"] = f"{psutil.virtual_memory().percent}%"
+                status["mem_ts"] = now
+
             uptime = datetime.now() - START_TIME
             uptime_str = str(uptime).split('.')[0] # HH:MM:SS
             
@@ -1269,17 +1813,8 @@ def launch_dashboard(args):
             table.add_column("Uptime", style="magenta")
             table.add_column("Memory", style="yellow")
             
-            p_count = len(config)
-            n_count = len(nodes_data)
-            
-            # Use psutil if available, otherwise dummy
-            try:
-                import psutil
-                mem = f"{psutil.virtual_memory().percent}%"
-            except ImportError:
-                mem = "N/A"
-                
-            table.add_row("RUNNING", f"{p_count} Active", f"{n_count} Configured", uptime_str, mem)
+            p_count, n_count = status["counts"]
+            table.add_row("RUNNING", f"{p_count} Active", f"{n_count} Configured", uptime_str, status["mem"])
             return Panel(table, title="[bold white]EEveon Engine v0.4.0-alpha[/bold white]", border_style="green")
 
         with Live(get_status_table(), refresh_per_second=2) as live:
@@ -1291,11 +1826,68 @@ def launch_dashboard(args):
         uvicorn.run(app, host=host, port=port)
 
 
+# `nodes sync` pushes to at most this many nodes at once, retrying each with backoff
+NODE_SYNC_CONCURRENCY = 8
+NODE_SYNC_ATTEMPTS = 4
+NODE_SYNC_BACKOFF_MAX_S = 30
+
+
+async def _sync_node(node_id, node, target_path, limiter):
+    """mkdir + rsync one node, retrying with exponential backoff; returns (node_id, ok)"""
+    import asyncio
+
+    try:
+        remote = f"{node['user']}@{node['ip']}"
+    except (KeyError, TypeError):
+        log(f"Node {node_id} has no user/ip configured; skipping", "ERROR")
+        return node_id, False
+    ssh_opts = ["-o", "ConnectTimeout=5", "-o", "StrictHostKeyChecking=no"]
+    steps = (
+        # The remote shell parses the ssh command; -s keeps rsync's remote path out of it
+        ["ssh", *ssh_opts, remote, f"mkdir -p {shlex.quote(str(target_path))}"],
+        ["rsync", "-az", "-s", "--delete", "-e", " ".join(["ssh", *ssh_opts]),
+         f"{target_path}/", f"{remote}:{target_path}/"],
+    )
+    async with limiter:
+        for attempt in range(NODE_SYNC_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(min(2 ** attempt, NODE_SYNC_BACKOFF_MAX_S))
+            for cmd in steps:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+                )
+                _, stderr = await proc.communicate()
+                if proc.returncode != 0:
+                    log(f"Sync to {node_id} failed (attempt {attempt + 1}/{NODE_SYNC_ATTEMPTS}): "
+                        f"{stderr.decode(errors='replace').strip()}", "WARNING")
+                    break
+            else:
+                return node_id, True
+    return node_id, False
+
+
+def sync_nodes(nodes_data, target_path):
+    """Push target_path to every node in parallel; returns {node_id: ok}"""
+    import asyncio
+
+    async def fanout():
+        limiter = asyncio.Semaphore(NODE_SYNC_CONCURRENCY)
+        return await asyncio.gather(*(
+            _sync_node(node_id, node, target_path, limiter)
+            for node_id, node in nodes_data.items()
+        ))
+
+    loop = asyncio.new_event_loop()
+    try:
+        return dict(loop.run_until_complete(fanout()))
+    finally:
+        loop.close()
+
+
 def manage_nodes(args):
     """Manage remote server nodes for multi-node deployment"""
     if not verify_admin(): return
     
-    nodes_file = CONFIG_DIR / "nodes.json"
     nodes_data = load_nodes()
 
     if args.action == 'add':
@@ -1309,8 +1901,7 @@ def manage_nodes(args):
             "added_at": datetime.now().isoformat(),
             "status": "active"
         }
-        with open(nodes_file, 'w') as f:
-            json.dump(nodes_data, f, indent=2)
+        save_nodes(nodes_data)
         log(f"Node '{node_id}' ({args.user}@{args.ip}) added successfully", "SUCCESS")
         
     elif args.action == 'list':
@@ -1325,34 +1916,89 @@ def manage_nodes(args):
     elif args.action == 'remove':
         if args.name in nodes_data:
             del nodes_data[args.name]
-            with open(nodes_file, 'w') as f:
-                json.dump(nodes_data, f, indent=2)
+            save_nodes(nodes_data)
             log(f"Node '{args.name}' removed", "SUCCESS")
         else:
             log(f"Node '{args.name}' not found", "ERROR")
 
+    elif args.action == 'sync':
+        if not args.project:
+            log("Usage: ee-deploy nodes sync --project <project>", "ERROR")
+            return
+        config = load_config()
+        if args.project not in config:
+            log(f"Pipeline '{args.project}' not found", "ERROR")
+            return
+        if not nodes_data:
+            log("No nodes configured", "WARNING")
+            return
+        deploy_path = config[args.project].get("deploy_path") or ""
+        if not deploy_path.strip():
+            # Path("") resolves to the cwd, which rsync --delete would then mirror to every node
+            log(f"Pipeline '{args.project}' has no deploy_path configured", "ERROR")
+            return
+        target_path = Path(deploy_path).resolve()
+        if not target_path.exists():
+            log(f"Deploy path not found: {target_path}", "ERROR")
+            return
+        log(f"Syncing {target_path} to {len(nodes_data)} nodes...", "INFO")
+        results = sync_nodes(nodes_data, target_path)
+        for node_id, ok in results.items():
+            if ok:
+                log(f"Sync to {node_id} complete", "SUCCESS")
+            else:
+                log(f"Sync to {node_id} failed", "ERROR")
+
 
 def remove_pipeline(args):
-    """Remove a pipeline configuration"""
+    """Remove one or more pipeline configurations"""
     if not verify_admin(): return
     config = load_config()
-    project_name = args.project
-    
-    if project_name not in config:
-        log(f"Pipeline '{project_name}' not found", "ERROR")
+    project_names = list(dict.fromkeys(args.project))
+
+    missing = [name for name in project_names if name not in config]
+    if missing:
+        for project_name in missing:
+            log(f"Pipeline '{project_name}' not found", "ERROR")
         return
-    
-    confirm = input(f"{Colors.YELLOW}Are you sure you want to remove '{project_name}'? (yes/no): {Colors.END}")
-    
-    if confirm.lower() == 'yes':
+
+    if not args.yes:
+        confirm = input(f"{Colors.YELLOW}Are you sure you want to remove '{', '.join(project_names)}'? (yes/no): {Colors.END}")
+        if confirm.lower() != 'yes':
+            log("Cancelled", "INFO")
+            return
+
+    for project_name in project_names:
         del config[project_name]
-        save_config(config)
+    # One save however many pipelines go
+    save_config(config)
+    for project_name in project_names:
         log(f"Pipeline '{project_name}' removed", "SUCCESS")
-    else:
-        log("Cancelled", "INFO")
 
 
-def main():
+class _SkippedParser:
+    """Stands in for a subcommand parser that this invocation will not use"""
+
+    def add_argument(self, *args, **kwargs):
+        pass
+
+    def set_defaults(self, **kwargs):
+        pass
+
+    def add_mutually_exclusive_group(self, **kwargs):
+        return self
+
+
+_SKIPPED_PARSER = _SkippedParser()
+
+
+@functools.lru_cache(maxsize=4)
+def _build_parser(command=None):
+    """The CLI parser, built once per process and reused by later main() calls.
+
+    With `command`, only that subcommand is registered, and None is returned if it
+    is not a known command so main() can fall back to the full parser.
+    """
     parser = argparse.ArgumentParser(
         description="Eeveon CI/CD Pipeline - Manage continuous deployment from GitHub",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1367,9 +2013,14 @@ Examples:
     )
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+    def add_command(name, **kwargs):
+        if command is not None and name != command:
+            return _SKIPPED_PARSER
+        return subparsers.add_parser(name, **kwargs)
     
     # Init command
-    init_parser = subparsers.add_parser('init', help='Initialize a new pipeline')
+    init_parser = add_command('init', help='Initialize a new pipeline')
     init_parser.add_argument('--repo', help='GitHub repository URL')
     init_parser.add_argument('--branch', default='main', help='Branch to deploy (default: main)')
     init_parser.add_argument('--path', help='Deployment path on server')
@@ -1383,95 +2034,96 @@ Examples:
     init_parser.set_defaults(func=init_pipeline)
 
     # Approve/Reject commands
-    approve_parser = subparsers.add_parser('approve', help='Approve a pending deployment')
+    approve_parser = add_command('approve', help='Approve a pending deployment')
     approve_parser.add_argument('project', help='Project name')
     approve_parser.set_defaults(func=approve_deployment)
 
-    reject_parser = subparsers.add_parser('reject', help='Reject a pending deployment')
+    reject_parser = add_command('reject', help='Reject a pending deployment')
     reject_parser.add_argument('project', help='Project name')
     reject_parser.set_defaults(func=reject_deployment)
 
     # Config command
-    config_parser = subparsers.add_parser('config', help='Update configuration')
+    config_parser = add_command('config', help='Update configuration')
     config_parser.add_argument('project', help='Project name')
     config_parser.add_argument('key', help='Config key to update (e.g., strategy, branch)')
     config_parser.add_argument('value', help='New value')
     config_parser.set_defaults(func=set_config)
 
     # List command
-    list_parser = subparsers.add_parser('list', help='List all pipelines')
+    list_parser = add_command('list', help='List all pipelines')
     list_parser.set_defaults(func=list_pipelines)
     
     # Start command
-    start_parser = subparsers.add_parser('start', help='Start monitoring a pipeline')
+    start_parser = add_command('start', help='Start monitoring a pipeline')
     start_parser.add_argument('project', help='Project name')
     start_parser.add_argument('-f', '--foreground', action='store_true', help='Run in foreground')
     start_parser.set_defaults(func=start_pipeline)
     
     # Stop command
-    stop_parser = subparsers.add_parser('stop', help='Stop a pipeline')
+    stop_parser = add_command('stop', help='Stop a pipeline')
     stop_parser.add_argument('project', help='Project name')
     stop_parser.set_defaults(func=stop_pipeline)
     
     # Deploy command
-    deploy_parser = subparsers.add_parser('deploy', help='Trigger immediate deployment')
+    deploy_parser = add_command('deploy', help='Trigger immediate deployment')
     deploy_parser.add_argument('project', help='Project name')
     deploy_parser.set_defaults(func=deploy_now)
     
     # Logs command
-    logs_parser = subparsers.add_parser('logs', help='Show deployment logs')
+    logs_parser = add_command('logs', help='Show deployment logs')
     logs_parser.add_argument('project', nargs='?', help='Project name (optional)')
     logs_parser.add_argument('-n', '--lines', type=int, help='Number of lines to show')
     logs_parser.set_defaults(func=show_logs)
     
     # Remove command
-    remove_parser = subparsers.add_parser('remove', help='Remove a pipeline')
-    remove_parser.add_argument('project', help='Project name')
+    remove_parser = add_command('remove', help='Remove a pipeline')
+    remove_parser.add_argument('project', nargs='+', help='Project name(s)')
+    remove_parser.add_argument('-y', '--yes', action='store_true', help='Skip the confirmation prompt')
     remove_parser.set_defaults(func=remove_pipeline)
 
     # Seed rollback history
-    seed_parser = subparsers.add_parser('seed-rollback', help='Seed rollback history from current deploy')
+    seed_parser = add_command('seed-rollback', help='Seed rollback history from current deploy')
     seed_parser.add_argument('project', help='Project name')
     seed_parser.add_argument('--keep', type=int, help='Keep last N backups (default: 5)')
     seed_parser.set_defaults(func=seed_rollback)
 
     # System command (Internal/Security)
-    system_parser = subparsers.add_parser('system', help='System-level operations')
+    system_parser = add_command('system', help='System-level operations')
     system_parser.add_argument('action', choices=['decrypt'], help='Action')
     system_parser.add_argument('value', help='Value to decrypt')
     system_parser.set_defaults(func=manage_system)
 
     # Check command
-    check_parser = subparsers.add_parser('check', help='Check system dependencies')
+    check_parser = add_command('check', help='Check system dependencies')
     check_parser.set_defaults(func=check_dependencies)
 
     # Vacuum command
-    vacuum_parser = subparsers.add_parser('vacuum', help='Rotate and clean up logs')
+    vacuum_parser = add_command('vacuum', help='Rotate and clean up logs')
     vacuum_parser.add_argument('--days', type=int, help='Retention period in days')
     vacuum_parser.set_defaults(func=rotate_logs)
 
     # Auth command
-    auth_parser = subparsers.add_parser('auth', help='Manage user roles (Admin Only)')
+    auth_parser = add_command('auth', help='Manage user roles (Admin Only)')
     auth_parser.add_argument('action', choices=['add', 'list', 'remove'], help='Action to perform')
     auth_parser.add_argument('user', nargs='?', help='User OS name')
     auth_parser.add_argument('role', choices=['admin', 'deployer', 'user'], nargs='?', help='Role to assign')
     auth_parser.set_defaults(func=manage_auth)
 
     # Webhook command
-    webhook_parser = subparsers.add_parser('webhook', help='Manage GitHub webhook settings (Admin Only)')
+    webhook_parser = add_command('webhook', help='Manage GitHub webhook settings (Admin Only)')
     webhook_parser.add_argument('action', choices=['enable', 'disable', 'secret', 'repo', 'branches'], help='Action to perform')
     webhook_parser.add_argument('project', help='Project name')
     webhook_parser.add_argument('value', nargs='?', help='Value for the action')
     webhook_parser.set_defaults(func=manage_webhook)
 
     # Dashboard command
-    dashboard_parser = subparsers.add_parser('dashboard', help='Launch the web dashboard')
+    dashboard_parser = add_command('dashboard', help='Launch the web dashboard')
     dashboard_parser.add_argument('--port', type=int, default=8080, help='Port to run on (default: 8080)')
     dashboard_parser.add_argument('--host', default='127.0.0.1', help='Host to bind to (default: 127.0.0.1)')
     dashboard_parser.set_defaults(func=launch_dashboard)
 
     # Secrets command
-    secrets_parser = subparsers.add_parser('secrets', help='Manage encrypted secrets')
+    secrets_parser = add_command('secrets', help='Manage encrypted secrets')
     secrets_parser.add_argument('action', choices=['set', 'list', 'remove'], help='Action to perform')
     secrets_parser.add_argument('project', help='Project name')
     secrets_parser.add_argument('key', nargs='?', help='Secret key')
@@ -1479,20 +2131,21 @@ Examples:
     secrets_parser.set_defaults(func=manage_secrets)
 
     # Internal: Decrypt env for deployment
-    decrypt_parser = subparsers.add_parser('decrypt-env', help=argparse.SUPPRESS)
+    decrypt_parser = add_command('decrypt-env', help=argparse.SUPPRESS)
     decrypt_parser.add_argument('project')
     decrypt_parser.set_defaults(func=decrypt_env)
 
     # Nodes command
-    nodes_parser = subparsers.add_parser('nodes', help='Manage remote server nodes (Admin Only)')
-    nodes_parser.add_argument('action', choices=['add', 'list', 'remove'], help='Action to perform')
+    nodes_parser = add_command('nodes', help='Manage remote server nodes (Admin Only)')
+    nodes_parser.add_argument('action', choices=['add', 'list', 'remove', 'sync'], help='Action to perform')
     nodes_parser.add_argument('ip', nargs='?', help='Node IP address')
     nodes_parser.add_argument('user', nargs='?', help='SSH username')
     nodes_parser.add_argument('--name', help='Node friendly name')
+    nodes_parser.add_argument('--project', help='Pipeline whose deploy path to sync')
     nodes_parser.set_defaults(func=manage_nodes)
 
     # AI command
-    ai_parser = subparsers.add_parser('ai', help='Parse NL into a safe tool call (no execution)')
+    ai_parser = add_command('ai', help='Parse NL into a safe tool call (no execution)')
     ai_parser.add_argument('request', nargs='+', help='Natural language request')
     ai_parser.add_argument('--provider', help='LLM provider (ollama or openai-compatible)')
     ai_parser.add_argument('--model', help='LLM model name (default: EEVEON_LLM_MODEL)')
@@ -1503,7 +2156,7 @@ Examples:
     ai_parser.set_defaults(func=ai_assist)
 
     # AI request workflow
-    ai_request_parser = subparsers.add_parser('ai-request', help='Queue a validated AI request')
+    ai_request_parser = add_command('ai-request', help='Queue a validated AI request')
     ai_request_parser.add_argument('request', nargs='+', help='Natural language request')
     ai_request_parser.add_argument('--provider', help='LLM provider (ollama or openai-compatible)')
     ai_request_parser.add_argument('--model', help='LLM model name (default: EEVEON_LLM_MODEL)')
@@ -1514,15 +2167,16 @@ Examples:
     ai_request_parser.add_argument('--auto', action='store_true', help='Execute if no confirmation required')
     ai_request_parser.set_defaults(func=ai_request)
 
-    ai_list_parser = subparsers.add_parser('ai-list', help='List AI requests')
+    ai_list_parser = add_command('ai-list', help='List AI requests (newest first)')
+    ai_list_parser.add_argument('-n', '--limit', type=int, help='Show only the N most recent requests')
     ai_list_parser.set_defaults(func=ai_list)
 
-    ai_approve_parser = subparsers.add_parser('ai-approve', help='Approve and execute an AI request')
+    ai_approve_parser = add_command('ai-approve', help='Approve and execute an AI request')
     ai_approve_parser.add_argument('request_id', help='AI request id')
     ai_approve_parser.set_defaults(func=ai_approve)
 
     # AI config
-    ai_config_parser = subparsers.add_parser('ai-config', help='Get or set AI configuration')
+    ai_config_parser = add_command('ai-config', help='Get or set AI configuration')
     ai_config_parser.add_argument('action', choices=['get', 'set'], help='Action to perform')
     ai_config_parser.add_argument('--provider', help='LLM provider (ollama or openai-compatible)')
     ai_config_parser.add_argument('--base-url', help='LLM endpoint')
@@ -1534,7 +2188,19 @@ Examples:
     auto_group.add_argument('--no-auto-execute', dest='auto_execute', action='store_false', help='Disable auto-execute')
     ai_config_parser.set_defaults(auto_execute=None, func=ai_config)
     
-    args = parser.parse_args()
+    if command is not None and command not in subparsers.choices:
+        return None
+    return parser
+
+
+def main():
+    argv = sys.argv[1:]
+    parser = None
+    if argv and not argv[0].startswith('-'):
+        parser = _build_parser(argv[0])
+    if parser is None:
+        parser = _build_parser()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
@@ -28,6 +28,7 @@ requirements = [
 optional_requirements = {
     "rich": ["rich>=13.0.0"],
     "monitoring": ["psutil>=5.0.0"],
+    "fast": ["orjson>=3.0.0"],
 }
 
 setup(
@@ -70,6 +71,7 @@ setup(
         "premium": optional_requirements["rich"] + optional_requirements["monitoring"],
         "rich": optional_requirements["rich"],
         "monitoring": optional_requirements["monitoring"],
+        "fast": optional_requirements["fast"],
         "dev": [
             "black>=22.0.0",
             "isort>=5.0.0",